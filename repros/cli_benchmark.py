@@ -0,0 +1,68 @@
+"""
+Wall-clock benchmark for the scratch CLI.
+
+Runs a few common commands in fresh interpreters and reports the
+min/mean/max time for each, so startup changes can be compared.
+
+Usage:
+    python repros/cli_benchmark.py                   # blocks and --help
+    python repros/cli_benchmark.py project.sb3       # also time 'info'
+    python repros/cli_benchmark.py -n 50 project.sb3
+
+For a per-module breakdown of a single run, set SCRATCH_IMPORTTIME=1:
+    SCRATCH_IMPORTTIME=1 scratch blocks
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+
+def run_command(args, runs):
+    """Run a CLI command several times and collect wall times.
+
+    Args:
+        args: Arguments passed to the scratch CLI
+        runs: Number of timed runs
+
+    Returns:
+        List of wall times in seconds
+    """
+    cmd = [sys.executable, '-m', 'scratch.cli', *args]
+    env = dict(os.environ)
+    env.pop('SCRATCH_IMPORTTIME', None)
+
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time scratch CLI commands')
+    parser.add_argument('sb3', nargs='?', help='Project to use for the info command')
+    parser.add_argument('-n', '--runs', type=int, default=20, help='Runs per command (default: 20)')
+    args = parser.parse_args()
+
+    commands = [
+        ['blocks'],
+        ['blocks', 'motion'],
+        ['--help'],
+    ]
+    if args.sb3:
+        commands.append(['info', args.sb3])
+
+    print(f"{'command':<30} {'min':>9} {'mean':>9} {'max':>9}")
+    for command in commands:
+        times = run_command(command, args.runs)
+        label = 'scratch ' + ' '.join(command)
+        print(f"{label:<30} {min(times) * 1000:>7.1f}ms {sum(times) / len(times) * 1000:>7.1f}ms "
+              f"{max(times) * 1000:>7.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -42,39 +42,78 @@ Convert existing Scratch projects:
     roundtrip_sb3("input.sb3", "output.sb3")
 """
 
-import inspect
-import os
-from pathlib import Path
+import sys
+from typing import TYPE_CHECKING
 
-from .transpiler import (
-    # Main transpiler class
-    ScratchTranspiler,
+# The transpiler and library are imported on first use (see __getattr__
+# below) so that importing the package -- e.g. to run a quick CLI
+# command -- does not load them up front.
+if TYPE_CHECKING:
+    from .transpiler import (
+        # Main transpiler class
+        ScratchTranspiler,
+        
+        # Reverse transpiler class
+        ScratchToPython,
+        
+        # Core functions
+        transpile_to_json,
+        save_sb3,
+        sb3_to_python,
+        convert_sb3_to_py,
+        roundtrip_sb3,
+    )
     
-    # Reverse transpiler class
-    ScratchToPython,
+    # Library functions
+    from .library import (
+        get_sprite_data,
+        get_costume_data_for_project,
+        get_sound_data_for_project,
+        find_sprite_by_name,
+        list_sprites,
+        list_sounds,
+        get_library_sound_for_project,
+        find_sound_by_name,
+        download_sprite_assets,
+    )
+
+# Re-exported name -> submodule that defines it
+_LAZY_EXPORTS = {
+    'ScratchTranspiler': 'transpiler',
+    'ScratchToPython': 'transpiler',
+    'transpile_to_json': 'transpiler',
+    'save_sb3': 'transpiler',
+    'sb3_to_python': 'transpiler',
+    'convert_sb3_to_py': 'transpiler',
+    'roundtrip_sb3': 'transpiler',
+    'get_sprite_data': 'library',
+    'get_costume_data_for_project': 'library',
+    'get_sound_data_for_project': 'library',
+    'find_sprite_by_name': 'library',
+    'list_sprites': 'library',
+    'list_sounds': 'library',
+    'get_library_sound_for_project': 'library',
+    'find_sound_by_name': 'library',
+    'download_sprite_assets': 'library',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     
-    # Core functions
-    transpile_to_json,
-    save_sb3,
-    sb3_to_python,
-    convert_sb3_to_py,
-    roundtrip_sb3,
-)
-
-# Library functions
-from .library import (
-    get_sprite_data,
-    get_costume_data_for_project,
-    get_sound_data_for_project,
-    find_sprite_by_name,
-    list_sprites,
-    list_sounds,
-    get_library_sound_for_project,
-    find_sound_by_name,
-    download_sprite_assets,
-)
-
-__version__ = "1.0.0"
+    from importlib import import_module
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+__version__ = "1.0.1"
 __author__ = "Scratch Transpiler"
 
 
@@ -105,32 +144,30 @@ def create_scratch_file(output: str = None):
         create_scratch_file()  # Creates <filename>.sb3
         create_scratch_file("my_game.sb3")  # Custom output name
     """
+    from pathlib import Path
+    from .transpiler import transpile_to_json, save_sb3
+    
     # Get the caller's frame to find the source file
-    frame = inspect.currentframe()
-    try:
-        caller_frame = frame.f_back
-        caller_file = caller_frame.f_globals.get('__file__')
-        
-        if caller_file is None:
-            raise RuntimeError("Cannot determine source file. Use transpile_to_json() and save_sb3() instead.")
-        
-        caller_path = Path(caller_file).resolve()
-        base_path = str(caller_path.parent)
-        
-        # Default output name: same as input but .sb3
-        if output is None:
-            output = str(caller_path.with_suffix('.sb3'))
-        
-        # Read the source code
-        with open(caller_path, 'r', encoding='utf-8') as f:
-            code = f.read()
-        
-        # Transpile and save (pass base_path for resolving relative asset paths)
-        json_str, custom_assets = transpile_to_json(code, base_path=base_path)
-        save_sb3(json_str, output, custom_assets=custom_assets)
-        
-    finally:
-        del frame
+    caller_file = sys._getframe(1).f_globals.get('__file__')
+    
+    if caller_file is None:
+        raise RuntimeError("Cannot determine source file. Use transpile_to_json() and save_sb3() instead.")
+    
+    caller_path = Path(caller_file).resolve()
+    base_path = str(caller_path.parent)
+    
+    # Default output name: same as input but .sb3
+    if output is None:
+        output = str(caller_path.with_suffix('.sb3'))
+    
+    # Read the source code (the parser decodes the raw bytes itself)
+    code = caller_path.read_bytes()
+    
+    # Transpile and save (pass base_path for resolving relative asset paths)
+    json_str, custom_assets = transpile_to_json(
+        code, base_path=base_path, filename=str(caller_path)
+    )
+    save_sb3(json_str, output, custom_assets=custom_assets)
 
 
 __all__ = [
@@ -6,63 +6,208 @@ from files (PNG, SVG, WAV, MP3) for use in Scratch projects.
 """
 
 import os
+import re
+import struct
 import hashlib
-import base64
-from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, List
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple, List, Union
+
+
+# Hash constructor used for asset IDs. Scratch identifies assets by the MD5
+# of their contents (assetId / md5ext), so this must stay MD5 for projects
+# that are uploaded to or re-saved by the online editor.
+_HASHER = hashlib.md5
+
+# Chunk size for streaming file hashes on Pythons without hashlib.file_digest
+_HASH_CHUNK_SIZE = 1 << 18
 
 
 def get_file_hash(file_path: str) -> str:
-    """Calculate MD5 hash of a file."""
+    """Calculate MD5 hash of a file without loading it all into memory."""
     with open(file_path, 'rb') as f:
-        return hashlib.md5(f.read()).hexdigest()
+        file_digest = getattr(hashlib, 'file_digest', None)
+        if file_digest is not None:
+            # Python 3.11+: C-level read/update loop
+            return file_digest(f, _HASHER).hexdigest()
+        h = _HASHER()
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            h.update(chunk)
+        return h.hexdigest()
 
 
-def get_data_hash(data: bytes) -> str:
-    """Calculate MD5 hash of bytes data."""
-    return hashlib.md5(data).hexdigest()
+def get_data_hash(data: Union[bytes, bytearray, memoryview]) -> str:
+    """
+    Calculate MD5 hash of bytes data.
+    
+    Accepts any bytes-like object; hashlib reads it through the buffer
+    protocol, so slices taken as memoryviews are hashed without copying.
+    """
+    return _HASHER(data).hexdigest()
 
 
 def get_string_hash(content: str) -> str:
     """Calculate MD5 hash of a string."""
-    return hashlib.md5(content.encode('utf-8')).hexdigest()
+    return _HASHER(content.encode('utf-8')).hexdigest()
 
 
-def get_image_dimensions(file_path: str) -> Tuple[int, int]:
+def _md5ext(asset_id: str, data_format: str) -> str:
+    """Build an asset's md5ext file name (e.g. '<md5>.png')."""
+    return asset_id + '.' + data_format
+
+
+def _suffix(path: str) -> str:
+    """Return the lowercase file extension, including the dot."""
+    return os.path.splitext(os.fspath(path))[1].lower()
+
+
+_READ_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+
+
+def _read_all(path: str) -> bytes:
     """
-    Get dimensions of an image file.
-    Returns (width, height).
+    Read a whole file with raw os.read calls.
     
-    Supports PNG, SVG (parsed from viewBox or width/height attributes).
+    Sizes the read from fstat, skipping the buffered file object layer,
+    so a regular file is normally read with a single syscall.
+    """
+    fd = os.open(path, _READ_FLAGS)
+    try:
+        size = os.fstat(fd).st_size
+        # Ask for one byte more than expected so hitting EOF is detectable
+        data = os.read(fd, size + 1)
+        if len(data) != size:
+            # Short read or the file changed size: read on until EOF
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, max(size, _HASH_CHUNK_SIZE))
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b''.join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+
+# Cache key: (absolute path, mtime in ns, size); value: (asset_id, data)
+FileCache = Dict[Tuple[str, int, int], Tuple[str, bytes]]
+
+
+def _load_file(full_path: str, cache: Optional[FileCache] = None) -> Tuple[str, bytes]:
+    """
+    Read and hash an asset file.
+    
+    If a cache is given, a file whose path, mtime and size are unchanged
+    since it was last loaded is served from the cache without touching
+    its contents again.
+    
+    Returns:
+        Tuple of (asset_id, asset_bytes)
+    """
+    if cache is not None:
+        st = os.stat(full_path)
+        key = (os.path.abspath(full_path), st.st_mtime_ns, st.st_size)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    
+    data = _read_all(full_path)
+    result = (get_data_hash(data), data)
+    
+    if cache is not None:
+        cache[key] = result
+    return result
+
+
+@lru_cache(maxsize=256)
+def _load_svg_string(svg_content: str) -> Tuple[str, bytes]:
+    """Encode and hash inline SVG content, memoized for repeated strings."""
+    data = svg_content.encode('utf-8')
+    return get_data_hash(data), data
+
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Binary header layouts, precompiled
+_PNG_WH = struct.Struct('>II')            # IHDR width, height
+_WAV_CHUNK_HDR = struct.Struct('<4sI')    # RIFF chunk id, size
+_WAV_FMT = struct.Struct('<HHIIHH')       # format, channels, rate, byte rate, align, bits
+
+
+def get_png_dimensions_from_bytes(data: bytes) -> Optional[Tuple[int, int]]:
     """
-    ext = Path(file_path).suffix.lower()
+    Get dimensions from PNG data (only the first 24 bytes are needed).
+    Returns (width, height), or None if the data is not a PNG.
+    """
+    if len(data) >= 24 and data[:8] == PNG_SIGNATURE:
+        # IHDR width/height follow the signature and chunk header
+        return _PNG_WH.unpack_from(data, 16)
+    return None
+
+
+def get_image_dimensions_from_bytes(data: bytes, ext: str) -> Tuple[int, int]:
+    """
+    Get dimensions of in-memory image data.
+    Returns (width, height).
     
+    Args:
+        data: Raw file contents
+        ext: Lowercase file extension including the dot (e.g. '.png')
+    """
     if ext == '.png':
-        # Read PNG header to get dimensions
-        with open(file_path, 'rb') as f:
-            data = f.read(24)
-            if data[:8] == b'\x89PNG\r\n\x1a\n':
-                # PNG signature found
-                width = int.from_bytes(data[16:20], 'big')
-                height = int.from_bytes(data[20:24], 'big')
-                return (width, height)
+        dimensions = get_png_dimensions_from_bytes(data)
+        if dimensions is not None:
+            return dimensions
     
     elif ext == '.svg':
-        # Parse SVG for dimensions
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return get_svg_dimensions(content)
+        return get_svg_dimensions(data)
     
     # Default fallback
     return (100, 100)
 
 
-def get_svg_dimensions(svg_content: str) -> Tuple[int, int]:
-    """Extract dimensions from SVG content."""
-    import re
+def get_image_dimensions(file_path: str) -> Tuple[int, int]:
+    """
+    Get dimensions of an image file.
+    Returns (width, height).
+    
+    Supports PNG, SVG (parsed from viewBox or width/height attributes).
+    """
+    ext = _suffix(file_path)
+    
+    if ext not in ('.png', '.svg'):
+        return (100, 100)
+    
+    with open(file_path, 'rb') as f:
+        # The PNG header is all we need; SVG has to be parsed in full
+        data = f.read(24) if ext == '.png' else f.read()
+    return get_image_dimensions_from_bytes(data, ext)
+
+
+@lru_cache(maxsize=None)
+def _get_svg_re() -> Tuple[Any, Any, Any]:
+    """
+    Return the compiled (viewBox, width, height) SVG patterns.
+    
+    The patterns match bytes, so SVG data is parsed in its encoded form.
+    They are compiled on first use so importing the package does not pay
+    for them when no SVG assets are loaded.
+    """
+    return (
+        re.compile(rb'viewBox\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE),
+        re.compile(rb'(?<![\w-])width\s*=\s*["\']?(\d+)', re.IGNORECASE),
+        re.compile(rb'(?<![\w-])height\s*=\s*["\']?(\d+)', re.IGNORECASE),
+    )
+
+
+def get_svg_dimensions(svg_content: Union[str, bytes]) -> Tuple[int, int]:
+    """Extract dimensions from SVG content (raw bytes, or a str to encode)."""
+    if isinstance(svg_content, str):
+        svg_content = svg_content.encode('utf-8')
+    viewbox_re, width_re, height_re = _get_svg_re()
     
     # Try viewBox first
-    viewbox_match = re.search(r'viewBox\s*=\s*["\']([^"\']+)["\']', svg_content)
+    viewbox_match = viewbox_re.search(svg_content)
     if viewbox_match:
         parts = viewbox_match.group(1).split()
         if len(parts) >= 4:
@@ -74,8 +219,8 @@ def get_svg_dimensions(svg_content: str) -> Tuple[int, int]:
                 pass
     
     # Try width/height attributes
-    width_match = re.search(r'width\s*=\s*["\']?(\d+)', svg_content)
-    height_match = re.search(r'height\s*=\s*["\']?(\d+)', svg_content)
+    width_match = width_re.search(svg_content)
+    height_match = height_re.search(svg_content)
     
     width = int(width_match.group(1)) if width_match else 100
     height = int(height_match.group(1)) if height_match else 100
@@ -83,13 +228,152 @@ def get_svg_dimensions(svg_content: str) -> Tuple[int, int]:
     return (width, height)
 
 
+class CostumeAsset:
+    """
+    A costume entry of a sprite, as stored in project.json.
+    
+    Uses __slots__ so per-asset records stay small; as_dict() builds the
+    project.json representation when the project is serialized.
+    """
+    
+    __slots__ = (
+        'name', 'bitmap_resolution', 'data_format', 'asset_id', 'md5ext',
+        'rotation_center_x', 'rotation_center_y',
+    )
+    
+    def __init__(
+        self,
+        name: str,
+        asset_id: str,
+        data_format: str,
+        rotation_center_x: int,
+        rotation_center_y: int,
+        bitmap_resolution: int = 1
+    ):
+        self.name = name
+        self.bitmap_resolution = bitmap_resolution
+        self.data_format = data_format
+        self.asset_id = asset_id
+        self.md5ext = _md5ext(asset_id, data_format)
+        self.rotation_center_x = rotation_center_x
+        self.rotation_center_y = rotation_center_y
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, {self.md5ext!r})"
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the project.json costume dictionary."""
+        return {
+            "name": self.name,
+            "bitmapResolution": self.bitmap_resolution,
+            "dataFormat": self.data_format,
+            "assetId": self.asset_id,
+            "md5ext": self.md5ext,
+            "rotationCenterX": self.rotation_center_x,
+            "rotationCenterY": self.rotation_center_y
+        }
+
+
+class BackdropAsset(CostumeAsset):
+    """A backdrop entry (a costume of the Stage), as stored in project.json."""
+    
+    __slots__ = ()
+
+
+class SoundAsset:
+    """
+    A sound entry of a sprite or the Stage, as stored in project.json.
+    
+    Uses __slots__ so per-asset records stay small; as_dict() builds the
+    project.json representation when the project is serialized.
+    """
+    
+    __slots__ = ('name', 'asset_id', 'data_format', 'md5ext', 'rate', 'sample_count')
+    
+    def __init__(
+        self,
+        name: str,
+        asset_id: str,
+        data_format: str,
+        rate: int,
+        sample_count: int
+    ):
+        self.name = name
+        self.asset_id = asset_id
+        self.data_format = data_format
+        self.md5ext = _md5ext(asset_id, data_format)
+        self.rate = rate
+        self.sample_count = sample_count
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, {self.md5ext!r})"
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the project.json sound dictionary."""
+        return {
+            "name": self.name,
+            "assetId": self.asset_id,
+            "dataFormat": self.data_format,
+            "format": "",  # Empty for wav/mp3
+            "rate": self.rate,
+            "sampleCount": self.sample_count,
+            "md5ext": self.md5ext
+        }
+
+
+# Supported file extensions -> (dataFormat, bitmapResolution)
+_IMAGE_FORMATS: Dict[str, Tuple[str, int]] = {
+    '.png': ('png', 2),  # PNG is typically higher resolution
+    '.svg': ('svg', 1),
+    '.xml': ('svg', 1),
+}
+
+# Supported file extensions -> dataFormat
+_SOUND_FORMATS: Dict[str, str] = {
+    '.wav': 'wav',
+    '.mp3': 'mp3',
+}
+
+
+# Asset formats that are already compressed; these are stored in the .sb3
+# without recompressing. WAV is left out: Scratch's PCM sounds do deflate.
+PRECOMPRESSED_FORMATS = frozenset(('png', 'jpg', 'jpeg', 'gif', 'mp3'))
+
+
+def is_precompressed(md5ext: str) -> bool:
+    """Check whether an asset should be stored uncompressed in the .sb3."""
+    return md5ext.rpartition('.')[2].lower() in PRECOMPRESSED_FORMATS
+
+
+def _resolve_asset_path(file_path: str, base_path: Optional[str], kind: str) -> str:
+    """Resolve a (possibly relative) asset path and check that it exists."""
+    if base_path and not os.path.isabs(file_path):
+        full_path = os.path.join(base_path, file_path)
+    else:
+        full_path = file_path
+    
+    if not os.path.exists(full_path):
+        raise FileNotFoundError(f"{kind.capitalize()} file not found: {full_path}")
+    
+    return full_path
+
+
+def _resolve_format(ext: str, table: Dict[str, Any], kind: str) -> Any:
+    """Look up the format entry for a file extension."""
+    try:
+        return table[ext]
+    except KeyError:
+        raise ValueError(f"Unsupported {kind} format: {ext}") from None
+
+
 def load_costume_from_file(
     name: str,
     file_path: str,
     rotation_center_x: int = None,
     rotation_center_y: int = None,
-    base_path: str = None
-) -> Tuple[Dict[str, Any], bytes]:
+    base_path: str = None,
+    cache: Optional[FileCache] = None
+) -> Tuple[CostumeAsset, bytes]:
     """
     Load a costume from an image file.
     
@@ -99,57 +383,32 @@ def load_costume_from_file(
         rotation_center_x: X center for rotation (default: center of image)
         rotation_center_y: Y center for rotation (default: center of image)
         base_path: Base path for resolving relative file paths
+        cache: Optional file cache shared across loads (see AssetManager)
         
     Returns:
-        Tuple of (costume_dict, asset_bytes)
+        Tuple of (CostumeAsset, asset_bytes)
     """
-    # Resolve path
-    if base_path and not os.path.isabs(file_path):
-        full_path = os.path.join(base_path, file_path)
-    else:
-        full_path = file_path
+    full_path = _resolve_asset_path(file_path, base_path, 'costume')
+    ext = _suffix(full_path)
+    data_format, bitmap_resolution = _resolve_format(ext, _IMAGE_FORMATS, 'costume')
     
-    if not os.path.exists(full_path):
-        raise FileNotFoundError(f"Costume file not found: {full_path}")
-    
-    ext = Path(full_path).suffix.lower()
-    
-    # Read file data
-    with open(full_path, 'rb') as f:
-        data = f.read()
+    # Read file data and calculate hash
+    asset_id, data = _load_file(full_path, cache)
     
-    # Calculate hash
-    asset_id = get_data_hash(data)
-    
-    # Determine format
-    if ext == '.png':
-        data_format = 'png'
-        bitmap_resolution = 2  # PNG is typically higher resolution
-    elif ext in ('.svg', '.xml'):
-        data_format = 'svg'
-        bitmap_resolution = 1
-    else:
-        raise ValueError(f"Unsupported costume format: {ext}")
-    
-    # Get dimensions for rotation center
-    width, height = get_image_dimensions(full_path)
+    # Get dimensions for rotation center from the data already read
+    width, height = get_image_dimensions_from_bytes(data, ext)
     
     if rotation_center_x is None:
         rotation_center_x = width // 2
     if rotation_center_y is None:
         rotation_center_y = height // 2
     
-    costume_dict = {
-        "name": name,
-        "bitmapResolution": bitmap_resolution,
-        "dataFormat": data_format,
-        "assetId": asset_id,
-        "md5ext": f"{asset_id}.{data_format}",
-        "rotationCenterX": rotation_center_x,
-        "rotationCenterY": rotation_center_y
-    }
+    costume = CostumeAsset(
+        name, asset_id, data_format,
+        rotation_center_x, rotation_center_y, bitmap_resolution
+    )
     
-    return costume_dict, data
+    return costume, data
 
 
 def load_costume_from_svg(
@@ -157,7 +416,7 @@ def load_costume_from_svg(
     svg_content: str,
     rotation_center_x: int = None,
     rotation_center_y: int = None
-) -> Tuple[Dict[str, Any], bytes]:
+) -> Tuple[CostumeAsset, bytes]:
     """
     Load a costume from SVG string content.
     
@@ -168,37 +427,29 @@ def load_costume_from_svg(
         rotation_center_y: Y center for rotation
         
     Returns:
-        Tuple of (costume_dict, asset_bytes)
+        Tuple of (CostumeAsset, asset_bytes)
     """
-    data = svg_content.encode('utf-8')
-    asset_id = get_data_hash(data)
+    asset_id, data = _load_svg_string(svg_content)
     
-    # Get dimensions
-    width, height = get_svg_dimensions(svg_content)
+    # Get dimensions from the encoded data
+    width, height = get_svg_dimensions(data)
     
     if rotation_center_x is None:
         rotation_center_x = width // 2
     if rotation_center_y is None:
         rotation_center_y = height // 2
     
-    costume_dict = {
-        "name": name,
-        "bitmapResolution": 1,
-        "dataFormat": "svg",
-        "assetId": asset_id,
-        "md5ext": f"{asset_id}.svg",
-        "rotationCenterX": rotation_center_x,
-        "rotationCenterY": rotation_center_y
-    }
+    costume = CostumeAsset(name, asset_id, 'svg', rotation_center_x, rotation_center_y)
     
-    return costume_dict, data
+    return costume, data
 
 
 def load_backdrop_from_file(
     name: str,
     file_path: str,
-    base_path: str = None
-) -> Tuple[Dict[str, Any], bytes]:
+    base_path: str = None,
+    cache: Optional[FileCache] = None
+) -> Tuple[BackdropAsset, bytes]:
     """
     Load a backdrop from an image file.
     
@@ -206,79 +457,44 @@ def load_backdrop_from_file(
         name: Backdrop name
         file_path: Path to image file (PNG or SVG)
         base_path: Base path for resolving relative file paths
+        cache: Optional file cache shared across loads (see AssetManager)
         
     Returns:
-        Tuple of (backdrop_dict, asset_bytes)
+        Tuple of (BackdropAsset, asset_bytes)
     """
-    # Resolve path
-    if base_path and not os.path.isabs(file_path):
-        full_path = os.path.join(base_path, file_path)
-    else:
-        full_path = file_path
-    
-    if not os.path.exists(full_path):
-        raise FileNotFoundError(f"Backdrop file not found: {full_path}")
+    full_path = _resolve_asset_path(file_path, base_path, 'backdrop')
+    ext = _suffix(full_path)
+    data_format, bitmap_resolution = _resolve_format(ext, _IMAGE_FORMATS, 'backdrop')
     
-    ext = Path(full_path).suffix.lower()
+    # Read file data and calculate hash
+    asset_id, data = _load_file(full_path, cache)
     
-    # Read file data
-    with open(full_path, 'rb') as f:
-        data = f.read()
+    # Standard Scratch stage center
+    backdrop = BackdropAsset(name, asset_id, data_format, 240, 180, bitmap_resolution)
     
-    # Calculate hash
-    asset_id = get_data_hash(data)
-    
-    # Determine format
-    if ext == '.png':
-        data_format = 'png'
-        bitmap_resolution = 2
-    elif ext in ('.svg', '.xml'):
-        data_format = 'svg'
-        bitmap_resolution = 1
-    else:
-        raise ValueError(f"Unsupported backdrop format: {ext}")
-    
-    backdrop_dict = {
-        "name": name,
-        "bitmapResolution": bitmap_resolution,
-        "dataFormat": data_format,
-        "assetId": asset_id,
-        "md5ext": f"{asset_id}.{data_format}",
-        "rotationCenterX": 240,  # Standard Scratch stage center
-        "rotationCenterY": 180
-    }
-    
-    return backdrop_dict, data
+    return backdrop, data
 
 
 def load_backdrop_from_svg(
     name: str,
     svg_content: str
-) -> Tuple[Dict[str, Any], bytes]:
+) -> Tuple[BackdropAsset, bytes]:
     """
     Load a backdrop from SVG string content.
     """
-    data = svg_content.encode('utf-8')
-    asset_id = get_data_hash(data)
+    asset_id, data = _load_svg_string(svg_content)
     
-    backdrop_dict = {
-        "name": name,
-        "bitmapResolution": 1,
-        "dataFormat": "svg",
-        "assetId": asset_id,
-        "md5ext": f"{asset_id}.svg",
-        "rotationCenterX": 240,
-        "rotationCenterY": 180
-    }
+    backdrop = BackdropAsset(name, asset_id, 'svg', 240, 180)
     
-    return backdrop_dict, data
+    return backdrop, data
 
 
 def load_sound_from_file(
     name: str,
     file_path: str,
-    base_path: str = None
-) -> Tuple[Dict[str, Any], bytes]:
+    base_path: str = None,
+    cache: Optional[FileCache] = None
+) -> Tuple[SoundAsset, bytes]:
     """
     Load a sound from an audio file.
     
@@ -286,51 +502,29 @@ def load_sound_from_file(
         name: Sound name
         file_path: Path to audio file (WAV or MP3)
         base_path: Base path for resolving relative file paths
+        cache: Optional file cache shared across loads (see AssetManager)
         
     Returns:
-        Tuple of (sound_dict, asset_bytes)
+        Tuple of (SoundAsset, asset_bytes)
     """
-    # Resolve path
-    if base_path and not os.path.isabs(file_path):
-        full_path = os.path.join(base_path, file_path)
-    else:
-        full_path = file_path
-    
-    if not os.path.exists(full_path):
-        raise FileNotFoundError(f"Sound file not found: {full_path}")
-    
-    ext = Path(full_path).suffix.lower()
-    
-    # Read file data
-    with open(full_path, 'rb') as f:
-        data = f.read()
+    full_path = _resolve_asset_path(file_path, base_path, 'sound')
+    ext = _suffix(full_path)
+    data_format = _resolve_format(ext, _SOUND_FORMATS, 'sound')
     
-    # Calculate hash
-    asset_id = get_data_hash(data)
+    # Read file data and calculate hash
+    asset_id, data = _load_file(full_path, cache)
     
-    # Determine format and get audio info
-    if ext == '.wav':
-        data_format = 'wav'
+    # Get audio info
+    if data_format == 'wav':
         rate, sample_count = get_wav_info(data)
-    elif ext == '.mp3':
-        data_format = 'mp3'
+    else:
         # MP3 doesn't need rate/sampleCount for Scratch
         rate = 48000  # Default
         sample_count = len(data)  # Approximation
-    else:
-        raise ValueError(f"Unsupported sound format: {ext}")
     
-    sound_dict = {
-        "name": name,
-        "assetId": asset_id,
-        "dataFormat": data_format,
-        "format": "",  # Empty for wav/mp3
-        "rate": rate,
-        "sampleCount": sample_count,
-        "md5ext": f"{asset_id}.{data_format}"
-    }
+    sound = SoundAsset(name, asset_id, data_format, rate, sample_count)
     
-    return sound_dict, data
+    return sound, data
 
 
 def get_wav_info(data: bytes) -> Tuple[int, int]:
@@ -344,67 +538,65 @@ def get_wav_info(data: bytes) -> Tuple[int, int]:
         if data[:4] != b'RIFF' or data[8:12] != b'WAVE':
             return (48000, len(data))
         
-        # Find fmt chunk
+        # Defaults in case the fmt chunk is missing or follows the data chunk
+        sample_rate = 48000
+        num_channels = 2
+        bits_per_sample = 16
+        
+        # Walk the RIFF chunks
+        unpack_chunk_header = _WAV_CHUNK_HDR.unpack_from
         pos = 12
-        while pos < len(data) - 8:
-            chunk_id = data[pos:pos+4]
-            chunk_size = int.from_bytes(data[pos+4:pos+8], 'little')
+        end = len(data) - 8
+        while pos <= end:
+            chunk_id, chunk_size = unpack_chunk_header(data, pos)
             
             if chunk_id == b'fmt ':
-                # Audio format at pos+8 (2 bytes)
-                # Num channels at pos+10 (2 bytes)
-                # Sample rate at pos+12 (4 bytes)
-                sample_rate = int.from_bytes(data[pos+12:pos+16], 'little')
-                
-                # Continue to find data chunk for sample count
-                pos += 8 + chunk_size
-                continue
+                _, num_channels, sample_rate, _, _, bits_per_sample = _WAV_FMT.unpack_from(data, pos + 8)
             
             elif chunk_id == b'data':
-                # Data size / (channels * bits_per_sample / 8)
-                # Simplified: assume stereo 16-bit
-                sample_count = chunk_size // 4
-                return (sample_rate if 'sample_rate' in dir() else 48000, sample_count)
+                # Data size / bytes per sample frame
+                frame_size = max(1, num_channels * bits_per_sample // 8)
+                return (sample_rate, chunk_size // frame_size)
             
-            pos += 8 + chunk_size
+            # Chunks are padded to an even number of bytes
+            pos += 8 + chunk_size + (chunk_size & 1)
         
         return (48000, len(data))
     except Exception:
         return (48000, len(data))
 
 
+@lru_cache(maxsize=64)
+def _build_default_svg(label: str, color: str, width: int, height: int) -> Tuple[str, bytes]:
+    """Render and hash a default costume SVG, memoized on its inputs."""
+    svg = f'''<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}">
+  <circle cx="{width//2}" cy="{height//2}" r="{min(width, height)//2 - 5}" 
+          fill="{color}" stroke="#3373CC" stroke-width="3"/>
+  <text x="{width//2}" y="{height//2 + 5}" text-anchor="middle" 
+        font-family="Arial" font-size="14" fill="white">{label}</text>
+</svg>'''
+    
+    data = svg.encode('utf-8')
+    return get_data_hash(data), data
+
+
 def create_default_costume_svg(
     name: str,
     color: str = "#4C97FF",
     width: int = 100,
     height: int = 100
-) -> Tuple[Dict[str, Any], bytes]:
+) -> Tuple[CostumeAsset, bytes]:
     """
     Create a simple default costume SVG (colored circle).
     
     Used when no custom costume is provided.
     """
-    svg = f'''<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}">
-  <circle cx="{width//2}" cy="{height//2}" r="{min(width, height)//2 - 5}" 
-          fill="{color}" stroke="#3373CC" stroke-width="3"/>
-  <text x="{width//2}" y="{height//2 + 5}" text-anchor="middle" 
-        font-family="Arial" font-size="14" fill="white">{name[:3]}</text>
-</svg>'''
+    # Only the first three characters of the name are drawn
+    asset_id, data = _build_default_svg(name[:3], color, width, height)
     
-    data = svg.encode('utf-8')
-    asset_id = get_data_hash(data)
-    
-    costume_dict = {
-        "name": name,
-        "bitmapResolution": 1,
-        "dataFormat": "svg",
-        "assetId": asset_id,
-        "md5ext": f"{asset_id}.svg",
-        "rotationCenterX": width // 2,
-        "rotationCenterY": height // 2
-    }
+    costume = CostumeAsset(name, asset_id, 'svg', width // 2, height // 2)
     
-    return costume_dict, data
+    return costume, data
 
 
 class AssetManager:
@@ -423,34 +615,94 @@ class AssetManager:
             base_path: Base path for resolving relative file paths
         """
         self.base_path = base_path or os.getcwd()
-        # Maps md5ext -> bytes
+        # Maps md5ext -> bytes (content-addressed, so duplicates share one entry)
         self.assets: Dict[str, bytes] = {}
+        # Files already read and hashed, keyed by (path, mtime_ns, size)
+        self._file_cache: FileCache = {}
     
-    def add_costume(
+    def _ingest(self, asset: Any, data: bytes) -> Dict[str, Any]:
+        """
+        Store an asset's bytes under its md5ext unless already present.
+        
+        Identical content referenced from several costumes/sounds (even
+        under different names or paths) keeps a single stored buffer.
+        
+        Returns:
+            The asset's project.json dictionary
+        """
+        self.assets.setdefault(asset.md5ext, data)
+        return asset.as_dict()
+    
+    def _load_costume(
         self,
         name: str,
         file_path: str = None,
         svg_string: str = None,
         rotation_center_x: int = None,
         rotation_center_y: int = None
-    ) -> Dict[str, Any]:
-        """
-        Add a costume and return its dictionary.
-        """
+    ) -> Tuple[CostumeAsset, bytes]:
+        """Load a costume without storing its bytes."""
         if svg_string:
-            costume_dict, data = load_costume_from_svg(
+            return load_costume_from_svg(
                 name, svg_string, rotation_center_x, rotation_center_y
             )
         elif file_path:
-            costume_dict, data = load_costume_from_file(
-                name, file_path, rotation_center_x, rotation_center_y, self.base_path
+            return load_costume_from_file(
+                name, file_path, rotation_center_x, rotation_center_y, self.base_path,
+                cache=self._file_cache
             )
         else:
             # Create default costume
-            costume_dict, data = create_default_costume_svg(name)
+            return create_default_costume_svg(name)
+    
+    def add_costume(
+        self,
+        name: str,
+        file_path: str = None,
+        svg_string: str = None,
+        rotation_center_x: int = None,
+        rotation_center_y: int = None
+    ) -> Dict[str, Any]:
+        """
+        Add a costume and return its dictionary.
+        """
+        costume, data = self._load_costume(
+            name, file_path, svg_string, rotation_center_x, rotation_center_y
+        )
+        return self._ingest(costume, data)
+    
+    def add_costumes_bulk(
+        self,
+        specs: List[Dict[str, Any]],
+        max_workers: int = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Add several costumes, reading and hashing files in parallel.
         
-        self.assets[costume_dict['md5ext']] = data
-        return costume_dict
+        Args:
+            specs: List of keyword dicts accepted by add_costume()
+                   (name, file_path, svg_string, rotation_center_x/y)
+            max_workers: Thread count (default: number of CPUs)
+            
+        Returns:
+            List of costume dicts, in the same order as specs
+        """
+        if not specs:
+            return []
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        workers = min(len(specs), max_workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Store results on this thread so self.assets is only touched
+            # here; ingesting as results arrive lets duplicate buffers be
+            # freed straight away instead of after the whole batch
+            return [
+                self._ingest(costume, data)
+                for costume, data in executor.map(
+                    lambda spec: self._load_costume(**spec), specs
+                )
+            ]
     
     def add_backdrop(
         self,
@@ -462,14 +714,15 @@ class AssetManager:
         Add a backdrop and return its dictionary.
         """
         if svg_string:
-            backdrop_dict, data = load_backdrop_from_svg(name, svg_string)
+            backdrop, data = load_backdrop_from_svg(name, svg_string)
         elif file_path:
-            backdrop_dict, data = load_backdrop_from_file(name, file_path, self.base_path)
+            backdrop, data = load_backdrop_from_file(
+                name, file_path, self.base_path, cache=self._file_cache
+            )
         else:
             raise ValueError("Must provide file_path or svg_string for backdrop")
         
-        self.assets[backdrop_dict['md5ext']] = data
-        return backdrop_dict
+        return self._ingest(backdrop, data)
     
     def add_sound(
         self,
@@ -479,9 +732,10 @@ class AssetManager:
         """
         Add a sound and return its dictionary.
         """
-        sound_dict, data = load_sound_from_file(name, file_path, self.base_path)
-        self.assets[sound_dict['md5ext']] = data
-        return sound_dict
+        sound, data = load_sound_from_file(
+            name, file_path, self.base_path, cache=self._file_cache
+        )
+        return self._ingest(sound, data)
     
     def get_assets(self) -> Dict[str, bytes]:
         """Get all collected assets."""
@@ -14,13 +14,63 @@ These functions are stubs - they document the Scratch API but don't execute.
 The actual execution happens when transpiled to .sb3 and run in Scratch.
 """
 
-from typing import Union, Any, List, Optional
+from __future__ import annotations
+
+import sys
+import math
+from typing import Union, Any, List, Optional, Callable, NamedTuple, Tuple
 
 # Type aliases for Scratch values
 Number = Union[int, float]
 ScratchValue = Union[str, int, float, bool]
 
 
+# ============================================================================
+# Option Values
+# ============================================================================
+# The strings accepted by blocks that take a fixed set of options, interned
+# so comparisons against them can short-circuit on identity.
+
+def _interned(*values: str) -> tuple:
+    return tuple(sys.intern(value) for value in values)
+
+EFFECTS = _interned("color", "fisheye", "whirl", "pixelate", "mosaic", "brightness", "ghost")
+SOUND_EFFECTS = _interned("pitch", "pan")
+ROTATION_STYLES = _interned("left-right", "don't rotate", "all around")
+LAYERS = _interned("front", "back")
+LAYER_DIRECTIONS = _interned("forward", "backward")
+STOP_OPTIONS = _interned("all", "this script", "other scripts in sprite")
+PROPERTIES = _interned(
+    "x position", "y position", "direction", "costume #", "costume name",
+    "backdrop #", "backdrop name", "size", "volume",
+)
+CURRENT_UNITS = _interned("year", "month", "date", "dayofweek", "hour", "minute", "second")
+MATH_OPS = _interned(
+    "abs", "floor", "ceiling", "sqrt", "sin", "cos", "tan",
+    "asin", "acos", "atan", "ln", "log", "e ^", "10 ^",
+)
+PEN_PARAMS = _interned("color", "saturation", "brightness", "transparency")
+
+# DSL function -> the option values its selector argument accepts, so
+# callers can validate with one dict lookup and a set probe instead of
+# an if/elif chain per function
+OPTION_VALUES = {
+    'change_effect': frozenset(EFFECTS),
+    'set_effect': frozenset(EFFECTS),
+    'change_effect_sound': frozenset(SOUND_EFFECTS),
+    'set_effect_sound': frozenset(SOUND_EFFECTS),
+    'set_rotation_style': frozenset(ROTATION_STYLES),
+    'go_to_layer': frozenset(LAYERS),
+    'change_layer': frozenset(LAYER_DIRECTIONS),
+    'stop': frozenset(STOP_OPTIONS),
+    'property_of': frozenset(PROPERTIES),
+    'current': frozenset(CURRENT_UNITS),
+    'math_op': frozenset(MATH_OPS),
+    'change_pen_param': frozenset(PEN_PARAMS),
+    'set_pen_param': frozenset(PEN_PARAMS),
+}
+
+
 # ============================================================================
 # Motion Blocks
 # ============================================================================
@@ -357,22 +407,30 @@ def username() -> str:
 # ============================================================================
 # Operators
 # ============================================================================
+# Keyword-only arguments starting with an underscore bind builtins locally
+# (a LOAD_FAST instead of a global + builtins lookup); they are internal
+# and should not be passed.
 
 def pick_random(from_val: Number, to_val: Number) -> Number:
     """Pick a random number between from_val and to_val (inclusive)."""
     return 0
 
-def join(str1: ScratchValue, str2: ScratchValue) -> str:
+def join(str1: ScratchValue, str2: ScratchValue, *, _str=str, _type=type) -> str:
     """Join two strings together."""
-    return str(str1) + str(str2)
+    # Skip the str() conversions when given strings (the common case)
+    if _type(str1) is _str:
+        if _type(str2) is _str:
+            return str1 + str2
+        return str1 + _str(str2)
+    return _str(str1) + _str(str2)
 
 def letter_of(index: Number, string: str) -> str:
     """Get the letter at the specified index (1-based)."""
     return ""
 
-def length_of(string: str) -> Number:
+def length_of(string: str, *, _len=len, _type=type, _isinstance=isinstance, _str=str) -> Number:
     """Get the length of a string."""
-    return len(string) if isinstance(string, str) else 0
+    return _len(string) if _type(string) is _str or _isinstance(string, _str) else 0
 
 def contains(string: str, substring: str) -> bool:
     """Check if string contains substring."""
@@ -382,13 +440,73 @@ def mod(a: Number, b: Number) -> Number:
     """Get the remainder of a divided by b."""
     return 0
 
-def round_num(n: Number) -> Number:
+def round_num(n: Number, *, _round=round) -> Number:
     """Round a number to the nearest integer."""
-    return round(n)
+    return _round(n)
+
+# The math operators follow scratch-vm: trig works in degrees and is
+# rounded to 10 places, and inputs outside a function's domain give NaN
+# or an infinity instead of raising
+
+def _finite_or(fn: Callable[[Number], Number]) -> Callable[[Number], Number]:
+    """Apply fn to finite inputs and pass inf/NaN through unchanged."""
+    return lambda n: fn(n) if math.isfinite(n) else n
+
+def _trig(fn: Callable[[float], float]) -> Callable[[Number], Number]:
+    """Degree-based sin/cos, rounded like Scratch; NaN for infinite angles."""
+    return lambda n: round(fn(math.radians(n)), 10) if math.isfinite(n) else math.nan
+
+def _tan(n: Number) -> Number:
+    """Degree-based tan, rounded like Scratch; +/-Infinity at the asymptotes."""
+    if not math.isfinite(n):
+        return math.nan
+    angle = math.fmod(n, 360)
+    if angle == 90 or angle == -270:
+        return math.inf
+    if angle == -90 or angle == 270:
+        return -math.inf
+    return round(math.tan(math.radians(n)), 10)
+
+def _log_fn(fn: Callable[[float], float]) -> Callable[[Number], Number]:
+    """Logarithm giving -Infinity at 0 and NaN below it."""
+    return lambda n: fn(n) if n > 0 else (-math.inf if n == 0 else math.nan)
+
+def _pow_fn(fn: Callable[[Number], float]) -> Callable[[Number], Number]:
+    """Exponential that overflows to Infinity."""
+    def power(n: Number) -> Number:
+        try:
+            return fn(n)
+        except OverflowError:
+            return math.inf
+    return power
+
+_MATH_OPS = {
+    "abs": abs,
+    "floor": _finite_or(math.floor),
+    "ceiling": _finite_or(math.ceil),
+    "sqrt": lambda n: math.sqrt(n) if n >= 0 else math.nan,
+    "sin": _trig(math.sin),
+    "cos": _trig(math.cos),
+    "tan": _tan,
+    "asin": lambda n: math.degrees(math.asin(n)) if -1 <= n <= 1 else math.nan,
+    "acos": lambda n: math.degrees(math.acos(n)) if -1 <= n <= 1 else math.nan,
+    "atan": lambda n: math.degrees(math.atan(n)),
+    "ln": _log_fn(math.log),
+    "log": _log_fn(math.log10),
+    "e ^": _pow_fn(math.exp),
+    "10 ^": _pow_fn(lambda n: 10.0 ** n),
+}
+
+def specialize_math_op(op: str) -> Callable[[Number], Number]:
+    """Get the one-argument function for a math operation, to call directly."""
+    try:
+        return _MATH_OPS[op]
+    except KeyError:
+        raise ValueError(f"Unknown math operation: {op!r}") from None
 
 def math_op(op: str, n: Number) -> Number:
     """Perform a math operation: "abs", "floor", "ceiling", "sqrt", "sin", "cos", "tan", "asin", "acos", "atan", "ln", "log", "e ^", "10 ^"."""
-    return 0
+    return specialize_math_op(op)(n)
 
 
 # ============================================================================
@@ -550,6 +668,8 @@ class Costume:
         costume = Costume("my_costume", "path/to/image.svg")
         costume = Costume("my_costume", svg_string="<svg>...</svg>")
     """
+    __slots__ = ('name', 'file_path', 'svg_string', 'rotation_center_x', 'rotation_center_y')
+    
     def __init__(
         self, 
         name: str, 
@@ -577,6 +697,8 @@ class Sound:
         sound = Sound("my_sound", "path/to/sound.wav")
         sound = Sound("my_sound", "path/to/sound.mp3")
     """
+    __slots__ = ('name', 'file_path', 'rate', 'sample_count')
+    
     def __init__(
         self,
         name: str,
@@ -612,6 +734,11 @@ class SpriteConfig:
             def when_flag_clicked(self):
                 say("Hello!")
     """
+    __slots__ = (
+        'costumes', 'sounds', 'x', 'y', 'size', 'direction',
+        'rotation_style', 'visible', 'draggable',
+    )
+    
     def __init__(
         self,
         costumes: List['Costume'] = None,
@@ -692,6 +819,8 @@ class BackdropConfig:
             Backdrop("cave", "backgrounds/cave.png"),
         ])
     """
+    __slots__ = ('backdrops',)
+    
     def __init__(self, backdrops: List['Backdrop'] = None):
         self.backdrops = backdrops or []
 
@@ -704,6 +833,8 @@ class Backdrop:
         backdrop = Backdrop("my_backdrop", "path/to/image.png")
         backdrop = Backdrop("my_backdrop", svg_string="<svg>...</svg>")
     """
+    __slots__ = ('name', 'file_path', 'svg_string')
+    
     def __init__(
         self,
         name: str,
@@ -719,6 +850,14 @@ class Backdrop:
             raise ValueError("Must provide either file_path or svg_string")
 
 
+class _StageConfig(NamedTuple):
+    """Stage configuration recorded by configure_stage()."""
+    backdrops: Tuple[Backdrop, ...]
+    sounds: Tuple[Sound, ...]
+    tempo: int
+    volume: int
+
+
 # Global stage configuration (set before classes)
 _stage_config = None
 
@@ -752,22 +891,25 @@ def configure_stage(
                 switch_backdrop("forest")
     """
     global _stage_config
-    _stage_config = {
-        'backdrops': backdrops or [],
-        'sounds': sounds or [],
-        'tempo': tempo,
-        'volume': volume
-    }
+    _stage_config = _StageConfig(
+        backdrops=tuple(backdrops or ()),
+        sounds=tuple(sounds or ()),
+        tempo=tempo,
+        volume=volume
+    )
 
 
-def get_stage_config():
-    """Get the current stage configuration (used by transpiler)."""
+def get_stage_config() -> Optional[_StageConfig]:
+    """
+    Get the current stage configuration, or None if configure_stage()
+    has not been called. Fields: backdrops, sounds, tempo, volume.
+    """
     return _stage_config
 
 
 # ============================================================================
 
-__all__ = [
+__all__ = (
     # Motion
     'move', 'turn_right', 'turn_left', 'go_to', 'go_to_xy', 'glide_to', 'glide_to_xy',
     'point_in_direction', 'point_towards', 'change_x', 'set_x', 'change_y', 'set_y',
@@ -815,7 +957,15 @@ __all__ = [
     # Types
     'Number', 'ScratchValue',
     
+    # Option values
+    'EFFECTS', 'SOUND_EFFECTS', 'ROTATION_STYLES', 'LAYERS', 'LAYER_DIRECTIONS',
+    'STOP_OPTIONS', 'PROPERTIES', 'CURRENT_UNITS', 'MATH_OPS', 'PEN_PARAMS',
+    'OPTION_VALUES',
+    
     # Sprite/Backdrop configuration
     'Costume', 'Sound', 'Backdrop', 'SpriteConfig', 'BackdropConfig',
     'sprite', 'configure_stage', 'get_stage_config',
-]
+)
+
+# For O(1) membership tests (e.g. "is this name part of the DSL?")
+_ALL_SET = frozenset(__all__)
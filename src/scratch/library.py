@@ -7,12 +7,27 @@ Assets are downloaded from the Scratch CDN and cached locally.
 """
 
 import os
+import sys
 import json
-import urllib.request
-import urllib.error
+import hashlib
+import logging
+import tempfile
+import http.client
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from urllib.parse import urlsplit, urljoin
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Iterator
 from importlib import resources
+from functools import lru_cache
+from bisect import bisect_right
+
+# orjson parses the bundled library files several times faster when installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
 
 # Scratch asset CDN URLs (try multiple in case one is down)
 SCRATCH_ASSET_URLS = [
@@ -20,6 +35,18 @@ SCRATCH_ASSET_URLS = [
     "https://cdn.assets.scratch.mit.edu/internalapi/asset/{md5ext}/get/",
 ]
 
+# Headers sent with every CDN request
+_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': '*/*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://scratch.mit.edu/'
+}
+
+_REQUEST_TIMEOUT = 15
+_MAX_REDIRECTS = 5
+_REDIRECT_CODES = frozenset((301, 302, 303, 307, 308))
+
 # Local cache directory (user's home directory for persistence)
 CACHE_DIR = os.path.join(os.path.expanduser("~"), ".scratch_transpiler", "asset_cache")
 
@@ -27,8 +54,9 @@ CACHE_DIR = os.path.join(os.path.expanduser("~"), ".scratch_transpiler", "asset_
 # Load sprite library from bundled JSON
 # ============================================================================
 
+@lru_cache(maxsize=None)
 def _get_data_path(filename: str) -> str:
-    """Get path to bundled data file."""
+    """Get path to bundled data file (resolved once per filename)."""
     try:
         # Python 3.9+
         ref = resources.files('scratch.data').joinpath(filename)
@@ -39,44 +67,194 @@ def _get_data_path(filename: str) -> str:
         return os.path.join(package_dir, 'data', filename)
 
 
-def load_sprite_library() -> Dict[str, Any]:
-    """Load the sprite library from bundled JSON file."""
+def _load_library_index(filename: str) -> Dict[str, Any]:
+    """Load a bundled library JSON list and index it by entry name."""
     try:
-        json_path = _get_data_path('sprites_library.json')
-        if os.path.exists(json_path):
-            with open(json_path, 'r', encoding='utf-8') as f:
-                sprites_list = json.load(f)
-                return {sprite['name']: sprite for sprite in sprites_list}
+        try:
+            # Read through importlib.resources so zipped installs work too
+            f = resources.files('scratch.data').joinpath(filename).open('rb')
+        except (AttributeError, TypeError):
+            # Python 3.8: no resources.files()
+            f = open(_get_data_path(filename), 'rb')
+        with f:
+            entries = _json_loads(f.read())
+        return dict(zip([entry['name'] for entry in entries], entries))
     except Exception as e:
         pass
     return {}
 
 
+def load_sprite_library() -> Dict[str, Any]:
+    """Load the sprite library from bundled JSON file."""
+    return _load_library_index('sprites_library.json')
+
+
 def load_sounds_library() -> Dict[str, Any]:
     """Load the sounds library from bundled JSON file."""
-    try:
-        json_path = _get_data_path('sounds_library.json')
-        if os.path.exists(json_path):
-            with open(json_path, 'r', encoding='utf-8') as f:
-                sounds_list = json.load(f)
-                return {sound['name']: sound for sound in sounds_list}
-    except Exception as e:
-        pass
-    return {}
+    return _load_library_index('sounds_library.json')
+
 
+# The libraries are parsed on first use rather than on import. Inside this
+# module use _sprites()/_sounds(); SPRITE_LIBRARY and SOUNDS_LIBRARY are
+# still available as module attributes through __getattr__ below.
+@lru_cache(maxsize=None)
+def _sprites() -> Dict[str, Any]:
+    """Get the sprite library, loading it on first call."""
+    return load_sprite_library()
 
-# Load libraries on import
-SPRITE_LIBRARY = load_sprite_library()
-SOUNDS_LIBRARY = load_sounds_library()
+
+@lru_cache(maxsize=None)
+def _sounds() -> Dict[str, Any]:
+    """Get the sounds library, loading it on first call."""
+    return load_sounds_library()
+
+
+class _NameIndex:
+    """
+    Case-insensitive lookup index over library names.
+    
+    Exact matches are a dict probe. Substring matches search one string of
+    all casefolded names joined by a separator, so the scan runs in C in a
+    single str.find() call; bisecting the name start offsets maps the hit
+    back to its name. The first hit is the first matching name in library
+    order, the same result as checking each name in turn.
+    """
+    __slots__ = ('by_folded', '_names', '_starts', '_haystack')
+    
+    _SEP = '\0'
+    
+    def __init__(self, names):
+        self.by_folded = {}
+        self._names = []
+        self._starts = []
+        folded_names = []
+        offset = 0
+        for name in names:
+            name_folded = name.casefold()
+            # Keep the first match, as the old linear scan did
+            self.by_folded.setdefault(name_folded, name)
+            self._names.append(name)
+            self._starts.append(offset)
+            folded_names.append(name_folded)
+            offset += len(name_folded) + 1
+        self._haystack = self._SEP.join(folded_names)
+    
+    def match(self, name_folded: str) -> Optional[str]:
+        """Get the name equal to name_folded, else the first containing it."""
+        name = self.by_folded.get(name_folded)
+        if name is not None:
+            return name
+        return self.find_containing(name_folded)
+    
+    def find_containing(self, name_folded: str) -> Optional[str]:
+        """Get the first name containing name_folded, or None."""
+        if not self._names:
+            return None
+        if self._SEP in name_folded:
+            return None
+        pos = self._haystack.find(name_folded)
+        if pos < 0:
+            return None
+        return self._names[bisect_right(self._starts, pos) - 1]
+    
+    def find_approximate(self, name_folded: str, max_errors: int) -> Optional[str]:
+        """
+        Get the first name containing name_folded with at most max_errors
+        character insertions, deletions or substitutions, or None.
+        
+        Uses the bit-parallel Shift-And matcher with errors (Wu-Manber):
+        bit j of state[d] is set when the first j + 1 query characters
+        match the text ending here with at most d errors, so each text
+        character costs a few integer shifts and ORs per error level.
+        """
+        if not self._names or self._SEP in name_folded:
+            return None
+        
+        m = len(name_folded)
+        if m <= max_errors:
+            return self._names[0]
+        
+        masks = {}
+        for j, c in enumerate(name_folded):
+            masks[c] = masks.get(c, 0) | (1 << j)
+        
+        full = (1 << m) - 1
+        accept = 1 << (m - 1)
+        # Query prefixes of up to d characters can be deleted outright
+        initial = [(1 << d) - 1 for d in range(max_errors + 1)]
+        state = initial[:]
+        sep = self._SEP
+        
+        for pos, c in enumerate(self._haystack):
+            if c == sep:
+                # Matches never span two names
+                state = initial[:]
+                continue
+            
+            mask = masks.get(c, 0)
+            prev_old = state[0]
+            prev_new = ((prev_old << 1) | 1) & mask
+            state[0] = prev_new
+            for d in range(1, max_errors + 1):
+                old = state[d]
+                new = (
+                    (((old << 1) | 1) & mask)    # match
+                    | prev_old                   # extra text character
+                    | (prev_old << 1)            # substitution
+                    | (prev_new << 1)            # missing text character
+                    | initial[d]
+                ) & full
+                state[d] = new
+                prev_old, prev_new = old, new
+            
+            if state[max_errors] & accept:
+                return self._names[bisect_right(self._starts, pos) - 1]
+        
+        return None
+
+
+@lru_cache(maxsize=None)
+def _sprite_indexes() -> _NameIndex:
+    """Get the case-insensitive lookup index for the sprite library."""
+    return _NameIndex(_sprites())
+
+
+@lru_cache(maxsize=None)
+def _sound_indexes() -> _NameIndex:
+    """Get the case-insensitive lookup index for the sounds library."""
+    return _NameIndex(_sounds())
+
+
+_LAZY_LIBRARIES = {
+    'SPRITE_LIBRARY': _sprites,
+    'SOUNDS_LIBRARY': _sounds,
+}
+
+
+def __getattr__(name):
+    loader = _LAZY_LIBRARIES.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = loader()
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
 
 # ============================================================================
 # Asset Download Functions
 # ============================================================================
 
+_cache_dir_ready = False
+
+
 def ensure_cache_dir():
     """Create cache directory if it doesn't exist."""
-    if not os.path.exists(CACHE_DIR):
-        os.makedirs(CACHE_DIR)
+    global _cache_dir_ready
+    if _cache_dir_ready:
+        return
+    # exist_ok: prefetch workers may race to create it
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    _cache_dir_ready = True
 
 
 def get_cache_path(asset_id: str, data_format: str) -> str:
@@ -84,79 +262,267 @@ def get_cache_path(asset_id: str, data_format: str) -> str:
     return os.path.join(CACHE_DIR, f"{asset_id}.{data_format}")
 
 
+# Idle kept-alive CDN connections, per host, shared by every thread and
+# call. A download checks one out and returns it once the response is
+# read, so a batch of downloads (and later batches) reuse warm
+# connections instead of paying a TCP + TLS handshake per asset.
+_MAX_IDLE_CONNECTIONS = 16
+_idle_connections = {}
+_idle_lock = threading.Lock()
+
+
+def _checkout_connection(host: str) -> http.client.HTTPSConnection:
+    """Take an idle connection to a CDN host, or open a new one."""
+    with _idle_lock:
+        idle = _idle_connections.get(host)
+        if idle:
+            return idle.pop()
+    return http.client.HTTPSConnection(host, timeout=_REQUEST_TIMEOUT)
+
+
+def _checkin_connection(host: str, conn: http.client.HTTPSConnection) -> None:
+    """Return a connection whose response has been fully read to the pool."""
+    with _idle_lock:
+        idle = _idle_connections.setdefault(host, [])
+        if len(idle) < _MAX_IDLE_CONNECTIONS:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _send_get(conn: http.client.HTTPSConnection, path: str) -> http.client.HTTPResponse:
+    conn.request('GET', path, headers=_REQUEST_HEADERS)
+    return conn.getresponse()
+
+
+def _http_get(url: str) -> Tuple[int, Optional[str], bytes]:
+    """
+    GET a URL over a pooled connection, following redirects.
+    Returns (status, Retry-After header, body).
+    """
+    for _ in range(_MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        host = parts.netloc
+        conn = _checkout_connection(host)
+        
+        try:
+            try:
+                response = _send_get(conn, path or '/')
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server closed the idle kept-alive connection; reconnect once
+                conn.close()
+                response = _send_get(conn, path or '/')
+            body = response.read()
+        except Exception:
+            conn.close()
+            raise
+        _checkin_connection(host, conn)
+        
+        location = response.getheader('Location')
+        if response.status in _REDIRECT_CODES and location:
+            url = urljoin(url, location)
+            continue
+        return response.status, response.getheader('Retry-After'), body
+    
+    raise http.client.HTTPException(f"Too many redirects for {url}")
+
+
+# Index in SCRATCH_ASSET_URLS of the host that last served an asset
+_preferred_url = 0
+
+
 def download_asset(asset_id: str, data_format: str, max_retries: int = 3, verbose: bool = True) -> Optional[bytes]:
     """
     Download an asset from the Scratch CDN with retry logic.
     Returns the asset data as bytes, or None if download fails.
+    Progress is reported through the module logger; verbose is ignored
+    and kept for compatibility.
     """
+    global _preferred_url
     md5ext = f"{asset_id}.{data_format}"
     
-    for url_template in SCRATCH_ASSET_URLS:
-        url = url_template.format(md5ext=md5ext)
+    # Start with the host that served the last download, so once one host
+    # is found to be down, later assets stop paying for its retries
+    url_count = len(SCRATCH_ASSET_URLS)
+    for offset in range(url_count):
+        url_index = (_preferred_url + offset) % url_count
+        url = SCRATCH_ASSET_URLS[url_index].format(md5ext=md5ext)
         
         for attempt in range(max_retries):
             try:
-                req = urllib.request.Request(url, headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    'Accept': '*/*',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Referer': 'https://scratch.mit.edu/'
-                })
-                with urllib.request.urlopen(req, timeout=15) as response:
-                    return response.read()
-            except urllib.error.HTTPError as e:
-                if e.code == 503 and attempt < max_retries - 1:
-                    wait_time = 2 ** attempt
-                    if verbose:
-                        print(f"    CDN returned 503, retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-                elif attempt < max_retries - 1:
-                    time.sleep(1)
-                    continue
+                status, retry_after, data = _http_get(url)
             except Exception as e:
                 if attempt < max_retries - 1:
                     time.sleep(1)
-                    continue
+                continue
+            
+            if status == 200:
+                # Asset IDs are the MD5 of the content, so a mismatch means
+                # a corrupted or truncated body
+                if hashlib.md5(data).hexdigest() == asset_id.lower():
+                    _preferred_url = url_index
+                    return data
+                logger.warning("    Checksum mismatch for %s", md5ext)
+                continue
+            
+            if status == 404:
+                # Retrying won't help; try the next host
+                break
+            
+            if attempt < max_retries - 1:
+                if status == 503:
+                    retry_after = retry_after or ''
+                    wait_time = min(int(retry_after), 30) if retry_after.isdigit() else 2 ** attempt
+                    logger.info("    CDN returned 503, retrying in %ss...", wait_time)
+                    time.sleep(wait_time)
+                else:
+                    time.sleep(1)
     
     return None
 
 
+def _write_cache_file(cache_path: str, data: bytes) -> None:
+    """
+    Write an asset to the cache atomically: the data goes to a temporary
+    file that is renamed into place, so an interrupted write never leaves
+    a partial asset behind to be served on the next run.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.part')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Downloads in progress, keyed by md5ext, so concurrent requests for the
+# same asset share one fetch instead of racing to download and write it
+_inflight_lock = threading.Lock()
+_inflight = {}
+
+
+def _read_cache_file(cache_path: str) -> Optional[bytes]:
+    if os.path.exists(cache_path):
+        with open(cache_path, 'rb') as f:
+            return f.read()
+    return None
+
+
 def get_cached_asset(asset_id: str, data_format: str, verbose: bool = True) -> Optional[bytes]:
     """
     Get an asset from cache or download it.
     Returns the asset data as bytes.
+    Progress is reported through the module logger; verbose is ignored
+    and kept for compatibility.
     """
     ensure_cache_dir()
     cache_path = get_cache_path(asset_id, data_format)
     
     # Check cache first
-    if os.path.exists(cache_path):
-        with open(cache_path, 'rb') as f:
-            return f.read()
+    data = _read_cache_file(cache_path)
+    if data is not None:
+        return data
+    
+    # Wait for another thread's download of the same asset, if any
+    md5ext = f"{asset_id}.{data_format}"
+    with _inflight_lock:
+        future = _inflight.get(md5ext)
+        if future is None:
+            from concurrent.futures import Future
+            future = _inflight[md5ext] = Future()
+            is_owner = True
+        else:
+            is_owner = False
     
-    # Download and cache
-    if verbose:
-        print(f"  Downloading {asset_id}.{data_format}...")
-    data = download_asset(asset_id, data_format, verbose=verbose)
+    if not is_owner:
+        return future.result()
+    
+    try:
+        # A download may have finished between the cache check and
+        # registering this one
+        data = _read_cache_file(cache_path)
+        if data is None:
+            data = _download_to_cache(asset_id, data_format, cache_path)
+        future.set_result(data)
+        return data
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[md5ext]
+
+
+def _download_to_cache(asset_id: str, data_format: str, cache_path: str) -> Optional[bytes]:
+    """Download an asset and store it in the cache."""
+    logger.info("  Downloading %s.%s...", asset_id, data_format)
+    data = download_asset(asset_id, data_format)
     
     if data:
-        with open(cache_path, 'wb') as f:
-            f.write(data)
+        _write_cache_file(cache_path, data)
         return data
     else:
-        if verbose:
-            print(f"    Failed to download {asset_id}.{data_format}")
+        logger.warning("    Failed to download %s.%s", asset_id, data_format)
         return None
 
 
+def prefetch_assets(
+    specs: Iterable[Tuple[str, str]],
+    max_workers: int = 16
+) -> Dict[str, Optional[bytes]]:
+    """
+    Get several assets from cache or the CDN concurrently.
+    
+    Args:
+        specs: (asset_id, data_format) pairs to fetch
+        max_workers: Maximum number of concurrent downloads
+    
+    Returns:
+        Dict mapping md5ext to the asset bytes (None if the download failed)
+    """
+    # Deduplicate so two workers never write the same cache file
+    specs = list(dict.fromkeys(specs))
+    if not specs:
+        return {}
+    
+    def fetch(spec):
+        return get_cached_asset(spec[0], spec[1])
+    
+    workers = min(len(specs), max_workers)
+    if workers <= 1:
+        results = map(fetch, specs)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # Downloads are network-bound, so threads overlap the round-trips
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(fetch, specs))
+    
+    return {
+        f"{asset_id}.{data_format}": data
+        for (asset_id, data_format), data in zip(specs, results)
+    }
+
+
 # ============================================================================
 # Sprite Data Functions
 # ============================================================================
 
+@lru_cache(maxsize=None)
+def _sorted_sprite_names() -> Tuple[str, ...]:
+    """Get all sprite names in sorted order (sorted once)."""
+    return tuple(sorted(_sprites()))
+
+
 def get_sprite_names() -> List[str]:
     """Get list of all available sprite names."""
-    return sorted(SPRITE_LIBRARY.keys())
+    return list(_sorted_sprite_names())
 
 
 def list_sprites() -> List[str]:
@@ -164,14 +530,19 @@ def list_sprites() -> List[str]:
     return get_sprite_names()
 
 
+@lru_cache(maxsize=1024)
 def get_sprite_data(sprite_name: str) -> Optional[Dict]:
-    """Get the full sprite data for a sprite name (case-insensitive)."""
-    if sprite_name in SPRITE_LIBRARY:
-        return SPRITE_LIBRARY[sprite_name]
+    """
+    Get the full sprite data for a sprite name (case-insensitive).
+    Results, including misses, are memoized per name.
+    """
+    sprites = _sprites()
+    if sprite_name in sprites:
+        return sprites[sprite_name]
     
-    for name, data in SPRITE_LIBRARY.items():
-        if name.lower() == sprite_name.lower():
-            return data
+    name = _sprite_indexes().by_folded.get(sprite_name.casefold())
+    if name is not None:
+        return sprites[name]
     
     return None
 
@@ -181,18 +552,11 @@ def find_sprite_by_name(name: str, fuzzy: bool = True) -> Optional[str]:
     Find a sprite by name, optionally with fuzzy matching.
     Returns the exact sprite name if found.
     """
-    if name in SPRITE_LIBRARY:
+    if name in _sprites():
         return name
     
     if fuzzy:
-        name_lower = name.lower()
-        for sprite_name in SPRITE_LIBRARY:
-            if sprite_name.lower() == name_lower:
-                return sprite_name
-        
-        for sprite_name in SPRITE_LIBRARY:
-            if name_lower in sprite_name.lower():
-                return sprite_name
+        return _sprite_indexes().match(name.casefold())
     
     return None
 
@@ -200,9 +564,30 @@ def find_sprite_by_name(name: str, fuzzy: bool = True) -> Optional[str]:
 def get_costume_data_for_project(sprite_name: str) -> Optional[List[Dict]]:
     """
     Get costume data formatted for use in a Scratch project.
-    Downloads assets if not cached.
     Returns list of costume dicts ready for project.json.
+    The result is built once per sprite; each call returns fresh copies.
+    """
+    costumes = _costume_entries(sprite_name)
+    if costumes is None:
+        return None
+    return [dict(costume) for costume in costumes]
+
+
+def get_sound_data_for_project(sprite_name: str) -> Optional[List[Dict]]:
+    """
+    Get sound data for a sprite, formatted for use in a Scratch project.
+    Returns list of sound dicts ready for project.json.
+    The result is built once per sprite; each call returns fresh copies.
     """
+    sounds = _sound_entries(sprite_name)
+    if sounds is None:
+        return None
+    return [dict(sound) for sound in sounds]
+
+
+@lru_cache(maxsize=512)
+def _costume_entries(sprite_name: str) -> Optional[Tuple[Dict, ...]]:
+    """Build the project.json costume entries for a sprite (memoized)."""
     sprite = get_sprite_data(sprite_name)
     if not sprite:
         return None
@@ -224,14 +609,12 @@ def get_costume_data_for_project(sprite_name: str) -> Optional[List[Dict]]:
         }
         costumes.append(costume_data)
     
-    return costumes
+    return tuple(costumes)
 
 
-def get_sound_data_for_project(sprite_name: str) -> Optional[List[Dict]]:
-    """
-    Get sound data for a sprite, formatted for use in a Scratch project.
-    Returns list of sound dicts ready for project.json.
-    """
+@lru_cache(maxsize=512)
+def _sound_entries(sprite_name: str) -> Optional[Tuple[Dict, ...]]:
+    """Build the project.json sound entries for a sprite (memoized)."""
     sprite = get_sprite_data(sprite_name)
     if not sprite:
         return None
@@ -253,16 +636,22 @@ def get_sound_data_for_project(sprite_name: str) -> Optional[List[Dict]]:
         }
         sounds.append(sound_data)
     
-    return sounds
+    return tuple(sounds)
 
 
 # ============================================================================
 # Sound Library Functions (standalone sounds, not sprite sounds)
 # ============================================================================
 
+@lru_cache(maxsize=None)
+def _sorted_sound_names() -> Tuple[str, ...]:
+    """Get all sound names in sorted order (sorted once)."""
+    return tuple(sorted(_sounds()))
+
+
 def get_sound_names() -> List[str]:
     """Get list of all available sound names from the sounds library."""
-    return sorted(SOUNDS_LIBRARY.keys())
+    return list(_sorted_sound_names())
 
 
 def list_sounds() -> List[str]:
@@ -270,35 +659,88 @@ def list_sounds() -> List[str]:
     return get_sound_names()
 
 
+def iter_sound_names() -> Iterator[str]:
+    """Iterate over all sound names in sorted order without copying them."""
+    return iter(_sorted_sound_names())
+
+
 def get_library_sound_data(sound_name: str) -> Optional[Dict]:
     """Get the full sound data for a sound name from sounds library (case-insensitive)."""
-    if sound_name in SOUNDS_LIBRARY:
-        return SOUNDS_LIBRARY[sound_name]
-    
-    for name, data in SOUNDS_LIBRARY.items():
-        if name.lower() == sound_name.lower():
-            return data
-    
-    return None
+    name = find_sound_by_name_exact(sound_name)
+    if name is None:
+        return None
+    return _sounds()[name]
 
 
-def find_sound_by_name(name: str, fuzzy: bool = True) -> Optional[str]:
+@lru_cache(maxsize=256)
+def find_sound_by_name_exact(name: str) -> Optional[str]:
+    """
+    Find a sound by its exact name, ignoring case, without fuzzy matching.
+    Returns the library sound name if found.
+    Results, including misses, are memoized per name.
+    """
+    if name in _sounds():
+        return name
+    return _sound_indexes().by_folded.get(name.casefold())
+
+
+@lru_cache(maxsize=256)
+def find_sound_by_name(name: str, fuzzy: bool = True, max_errors: int = 0) -> Optional[str]:
     """
     Find a sound by name, optionally with fuzzy matching.
     Returns the exact sound name if found.
+    
+    With fuzzy matching, a sound whose name contains the query is
+    returned; if there is none and max_errors > 0, the first sound whose
+    name contains the query with at most that many typos is returned.
+    Results, including misses, are memoized.
     """
-    if name in SOUNDS_LIBRARY:
+    if name in _sounds():
         return name
     
     if fuzzy:
-        name_lower = name.lower()
-        for sound_name in SOUNDS_LIBRARY:
-            if sound_name.lower() == name_lower:
-                return sound_name
-        
-        for sound_name in SOUNDS_LIBRARY:
-            if name_lower in sound_name.lower():
-                return sound_name
+        return _find_sound_fuzzy(name.casefold(), max_errors)
+    
+    return None
+
+
+def find_sounds_by_names(names: Iterable[str], fuzzy: bool = True, max_errors: int = 0) -> List[Optional[str]]:
+    """
+    Find many sounds at once, e.g. every sound a project refers to.
+    Returns one result per name, the same as calling find_sound_by_name()
+    for each, but exact and case-insensitive hits are resolved in a single
+    loop without per-name call overhead.
+    """
+    sounds = _sounds()
+    by_folded = _sound_indexes().by_folded
+    results = []
+    append = results.append
+    for name in names:
+        if name in sounds:
+            append(name)
+        elif not fuzzy:
+            append(None)
+        else:
+            name_folded = name.casefold()
+            sound_name = by_folded.get(name_folded)
+            if sound_name is None:
+                sound_name = _find_sound_fuzzy(name_folded, max_errors)
+            append(sound_name)
+    return results
+
+
+def _find_sound_fuzzy(name_folded: str, max_errors: int) -> Optional[str]:
+    """Match a casefolded name exactly, then by substring, then with typos."""
+    index = _sound_indexes()
+    sound_name = index.match(name_folded)
+    if sound_name is not None:
+        return sound_name
+    
+    # Prefer the fewest typos
+    for errors in range(1, max_errors + 1):
+        sound_name = index.find_approximate(name_folded, errors)
+        if sound_name is not None:
+            return sound_name
     
     return None
 
@@ -307,79 +749,107 @@ def get_library_sound_for_project(sound_name: str) -> Optional[Dict]:
     """
     Get sound data from the sounds library formatted for use in a Scratch project.
     Returns a sound dict ready for project.json, or None if not found.
+    Each call returns a fresh copy of a precomputed entry.
     """
-    sound = get_library_sound_data(sound_name)
-    if not sound:
+    name = find_sound_by_name_exact(sound_name)
+    if name is None:
         return None
-    
-    asset_id = sound['assetId']
-    data_format = sound.get('dataFormat', '') or 'wav'
-    md5ext = sound.get('md5ext', f"{asset_id}.{data_format}")
-    
-    if not data_format and '.' in md5ext:
-        data_format = md5ext.split('.')[-1]
-    
-    sound_data = {
-        "name": sound['name'],
-        "assetId": asset_id,
-        "md5ext": md5ext,
-        "dataFormat": data_format,
-        "format": "",
-        "rate": sound.get('rate', 44100),
-        "sampleCount": sound.get('sampleCount', 0)
-    }
-    
-    return sound_data
+    return dict(_sound_project_templates()[name])
+
+
+@lru_cache(maxsize=None)
+def _sound_project_templates() -> Dict[str, Dict]:
+    """
+    Build the project.json entry for every library sound, keyed by name.
+    String fields are interned so every copy handed out shares them.
+    """
+    intern = sys.intern
+    templates = {}
+    for name, sound in _sounds().items():
+        asset_id = intern(sound['assetId'])
+        data_format = intern(sound.get('dataFormat', '') or 'wav')
+        md5ext = intern(sound.get('md5ext', f"{asset_id}.{data_format}"))
+        
+        templates[name] = {
+            "name": intern(sound['name']),
+            "assetId": asset_id,
+            "md5ext": md5ext,
+            "dataFormat": data_format,
+            "format": "",
+            "rate": sound.get('rate', 44100),
+            "sampleCount": sound.get('sampleCount', 0)
+        }
+    return templates
+
+
+@lru_cache(maxsize=None)
+def _sound_download_info() -> Dict[str, Tuple[str, str]]:
+    """Get (asset_id, data_format) to download for every library sound."""
+    info = {}
+    for name, sound in _sounds().items():
+        md5ext = sound.get('md5ext', '')
+        if '.' in md5ext:
+            data_format = md5ext.rsplit('.', 1)[1]
+        else:
+            data_format = sound.get('dataFormat', '') or 'wav'
+        info[name] = (sound['assetId'], data_format)
+    return info
+
+
+def clear_project_cache():
+    """Clear the memoized costume and sound data for project.json."""
+    _costume_entries.cache_clear()
+    _sound_entries.cache_clear()
+    _sound_project_templates.cache_clear()
 
 
 def download_library_sound(sound_name: str, verbose: bool = True) -> bool:
     """
     Download a sound from the sounds library to the cache.
     Returns True if successful.
+    Progress is reported through the module logger; verbose is ignored
+    and kept for compatibility.
     """
-    sound = get_library_sound_data(sound_name)
-    if not sound:
-        if verbose:
-            print(f"Sound '{sound_name}' not found in sounds library")
+    name = find_sound_by_name_exact(sound_name)
+    if name is None:
+        logger.warning("Sound '%s' not found in sounds library", sound_name)
         return False
     
-    asset_id = sound['assetId']
-    md5ext = sound.get('md5ext', '')
-    
-    if '.' in md5ext:
-        data_format = md5ext.split('.')[-1]
-    else:
-        data_format = sound.get('dataFormat', '') or 'wav'
-    
+    asset_id, data_format = _sound_download_info()[name]
     data = get_cached_asset(asset_id, data_format, verbose=verbose)
     return data is not None
 
 
-def download_sprite_assets(sprite_name: str, verbose: bool = True) -> Dict[str, bool]:
+def download_sprite_assets(sprite_name: str, verbose: bool = True, max_workers: int = 8) -> Dict[str, bool]:
     """
     Download all assets (costumes and sounds) for a sprite.
+    Assets are fetched concurrently, up to max_workers at a time.
     Returns dict mapping asset md5ext to success status.
+    Progress is reported through the module logger; verbose is ignored
+    and kept for compatibility.
     """
-    sprite = get_sprite_data(sprite_name)
-    if not sprite:
-        if verbose:
-            print(f"Sprite '{sprite_name}' not found in library")
+    specs = _sprite_asset_specs(sprite_name)
+    if specs is None:
+        logger.warning("Sprite '%s' not found in library", sprite_name)
         return {}
     
-    results = {}
+    assets = prefetch_assets(specs, max_workers=max_workers)
     
-    for costume in sprite.get('costumes', []):
-        asset_id = costume['assetId']
-        data_format = costume['dataFormat']
-        md5ext = f"{asset_id}.{data_format}"
-        data = get_cached_asset(asset_id, data_format, verbose=verbose)
-        results[md5ext] = data is not None
-    
-    for sound in sprite.get('sounds', []):
-        asset_id = sound['assetId']
-        data_format = sound['dataFormat']
-        md5ext = f"{asset_id}.{data_format}"
-        data = get_cached_asset(asset_id, data_format, verbose=verbose)
-        results[md5ext] = data is not None
+    return {md5ext: data is not None for md5ext, data in assets.items()}
+
+
+@lru_cache(maxsize=512)
+def _sprite_asset_specs(sprite_name: str) -> Optional[Tuple[Tuple[str, str], ...]]:
+    """Get the unique (asset_id, data_format) pairs a sprite uses (memoized)."""
+    sprite = get_sprite_data(sprite_name)
+    if not sprite:
+        return None
     
-    return results
+    # Costumes and sounds can share an asset; each is fetched once and its
+    # md5ext key covers every entry that refers to it
+    specs = dict.fromkeys(
+        (asset['assetId'], asset['dataFormat'])
+        for assets in (sprite.get('costumes', ()), sprite.get('sounds', ()))
+        for asset in assets
+    )
+    return tuple(specs)
@@ -6,20 +6,21 @@ using the ast module to parse and walk the Abstract Syntax Tree.
 """
 
 import ast
-import uuid
+import sys
 import json
+import string
 import zipfile
 import hashlib
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable
 
 # Import sprite library for official Scratch assets
 try:
     from .library import (
         get_sprite_data, get_costume_data_for_project, 
-        get_sound_data_for_project, get_cached_asset,
-        SPRITE_LIBRARY, find_sprite_by_name,
+        get_sound_data_for_project, prefetch_assets,
+        find_sprite_by_name,
         get_library_sound_for_project, get_library_sound_data,
-        find_sound_by_name, SOUNDS_LIBRARY, download_library_sound
+        find_sound_by_name, download_library_sound
     )
     SPRITE_LIBRARY_AVAILABLE = True
 except ImportError:
@@ -27,16 +28,47 @@ except ImportError:
     try:
         from sprite_library import (
             get_sprite_data, get_costume_data_for_project, 
-            get_sound_data_for_project, get_cached_asset,
-            SPRITE_LIBRARY, find_sprite_by_name,
+            get_sound_data_for_project,
+            find_sprite_by_name,
             get_library_sound_for_project, get_library_sound_data,
-            find_sound_by_name, SOUNDS_LIBRARY, download_library_sound
+            find_sound_by_name, download_library_sound
         )
+        try:
+            from sprite_library import prefetch_assets
+        except ImportError:
+            # Older sprite_library without batch downloads: fetch one at a time
+            from sprite_library import get_cached_asset
+            
+            def prefetch_assets(specs, max_workers=16):
+                return {
+                    f"{asset_id}.{data_format}": get_cached_asset(asset_id, data_format)
+                    for asset_id, data_format in dict.fromkeys(specs)
+                }
         SPRITE_LIBRARY_AVAILABLE = True
     except ImportError:
         SPRITE_LIBRARY_AVAILABLE = False
-        SPRITE_LIBRARY = {}
-        SOUNDS_LIBRARY = {}
+
+
+class _VarRef:
+    """Value from _extract_value that reads a variable."""
+    __slots__ = ('name',)
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    def __repr__(self) -> str:
+        return f"_VarRef({self.name!r})"
+
+
+class _BlockRef:
+    """Value from _extract_value that is a reporter block already created."""
+    __slots__ = ('block_id',)
+    
+    def __init__(self, block_id: str):
+        self.block_id = block_id
+    
+    def __repr__(self) -> str:
+        return f"_BlockRef({self.block_id!r})"
 
 
 class ScratchTranspiler(ast.NodeVisitor):
@@ -210,24 +242,23 @@ class ScratchTranspiler(ast.NodeVisitor):
         'think_for_secs': ('looks_thinkforsecs', ['MESSAGE', 'SECS']),
         # Control
         'create_clone_of': ('control_create_clone_of', ['CLONE_OPTION']),
-        # Sensing - timer
-        'reset_timer': ('sensing_resettimer', []),
     }
     
     # Field+Input function mappings: func_name -> (opcode, field_name, input_name, valid_field_values)
+    # (valid values are frozensets so membership tests are O(1))
     # First arg is a string field, second arg is numeric input
     FIELD_INPUT_MAP = {
         'change_effect': ('looks_changeeffectby', 'EFFECT', 'CHANGE',
-                          ['COLOR', 'FISHEYE', 'WHIRL', 'PIXELATE', 'MOSAIC', 'BRIGHTNESS', 'GHOST']),
+                          frozenset({'COLOR', 'FISHEYE', 'WHIRL', 'PIXELATE', 'MOSAIC', 'BRIGHTNESS', 'GHOST'})),
         'set_effect': ('looks_seteffectto', 'EFFECT', 'VALUE',
-                       ['COLOR', 'FISHEYE', 'WHIRL', 'PIXELATE', 'MOSAIC', 'BRIGHTNESS', 'GHOST']),
+                       frozenset({'COLOR', 'FISHEYE', 'WHIRL', 'PIXELATE', 'MOSAIC', 'BRIGHTNESS', 'GHOST'})),
         'change_layer': ('looks_goforwardbackwardlayers', 'FORWARD_BACKWARD', 'NUM',
-                         ['forward', 'backward']),
+                         frozenset({'forward', 'backward'})),
         # Sound effects
         'change_sound_effect': ('sound_changeeffectby', 'EFFECT', 'VALUE',
-                                ['PITCH', 'PAN']),
+                                frozenset({'PITCH', 'PAN'})),
         'set_sound_effect': ('sound_seteffectto', 'EFFECT', 'VALUE',
-                             ['PITCH', 'PAN']),
+                             frozenset({'PITCH', 'PAN'})),
     }
     
     # No-argument function mappings: func_name -> opcode
@@ -268,14 +299,15 @@ class ScratchTranspiler(ast.NodeVisitor):
     }
     
     # Field-based function mappings: func_name -> (opcode, field_name, valid_values)
+    # (valid values are frozensets, as in FIELD_INPUT_MAP)
     # These use fields instead of inputs (like rotation style)
     FIELD_FUNCTION_MAP = {
         'set_rotation_style': ('motion_setrotationstyle', 'STYLE', 
-                               ['left-right', 'don\'t rotate', 'all around']),
+                               frozenset({'left-right', 'don\'t rotate', 'all around'})),
         'go_to_layer': ('looks_gotofrontback', 'FRONT_BACK',
-                        ['front', 'back']),
+                        frozenset({'front', 'back'})),
         # Control - stop block
-        'stop': ('control_stop', 'STOP_OPTION', ['all', 'this script', 'other scripts in sprite']),
+        'stop': ('control_stop', 'STOP_OPTION', frozenset({'all', 'this script', 'other scripts in sprite'})),
     }
     
     # Reporter functions (return values, used in expressions)
@@ -338,6 +370,55 @@ class ScratchTranspiler(ast.NodeVisitor):
         ast.FloorDiv: 'operator_divide',  # Scratch doesn't have floor div, use regular
     }
     
+    # Number literals in the usual angle and stage coordinate range,
+    # pre-converted for _create_literal_input
+    _SMALL_INT_MIN = -360
+    _SMALL_INT_MAX = 720
+    _SMALL_INT_STRS = tuple(str(i) for i in range(_SMALL_INT_MIN, _SMALL_INT_MAX + 1))
+    
+    # Characters used in generated IDs (see _generate_id); the first 52 are
+    # letters, which is all the leading character may use
+    _ID_ALPHABET = string.ascii_letters + string.digits
+    
+    # Default shadow values for inputs holding a reporter. Every such input
+    # refers to the same list; the project is only serialized, never
+    # edited in place, so sharing them is safe.
+    _DEFAULT_NUM_SHADOW = [4, "0"]
+    _EMPTY_TEXT_SHADOW = [10, ""]
+    
+    # Key order and defaults shared by every block; _create_block and the
+    # reporter helpers copy this and fill in the rest
+    _BLOCK_TEMPLATE = {
+        "opcode": None,
+        "next": None,
+        "parent": None,
+        "inputs": None,
+        "fields": None,
+        "shadow": False,
+        "topLevel": False,
+    }
+    
+    # Fields that generic_visit walks for compound statements with no
+    # visit_* method of their own (or that fall back to generic_visit).
+    # Only nested statements can become blocks there, so expression fields
+    # such as decorators, default arguments and with-items are skipped.
+    _STMT_ONLY_FIELDS = {
+        ast.Module: ('body',),
+        ast.FunctionDef: ('body',),
+        ast.AsyncFunctionDef: ('body',),
+        ast.ClassDef: ('body',),
+        ast.For: ('body', 'orelse'),
+        ast.AsyncFor: ('body', 'orelse'),
+        ast.While: ('body', 'orelse'),
+        ast.If: ('body', 'orelse'),
+        ast.With: ('body',),
+        ast.AsyncWith: ('body',),
+        ast.Try: ('body', 'handlers', 'orelse', 'finalbody'),
+        ast.ExceptHandler: ('body',),
+    }
+    if sys.version_info >= (3, 11):
+        _STMT_ONLY_FIELDS[ast.TryStar] = ('body', 'handlers', 'orelse', 'finalbody')
+    
     def __init__(self):
         self.blocks: Dict[str, Dict[str, Any]] = {}
         self.current_parent_id: Optional[str] = None
@@ -375,6 +456,70 @@ class ScratchTranspiler(ast.NodeVisitor):
         # Stage blocks/variables (for code outside classes)
         self.stage_blocks: Dict[str, Dict[str, Any]] = {}
         self.stage_variables: Dict[str, List[Any]] = {}
+        
+        # data_variable reporter blocks per variable name, reset along with
+        # variable_ids (see _create_variable_reporter)
+        self._var_reporter_templates: Dict[str, Dict[str, Any]] = {}
+        
+        # Menu shadow blocks by (opcode, field, value) (see _create_menu_block)
+        self._menu_templates: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        
+        # Block ID generation (see _generate_id)
+        self._id_counter = 0
+        
+        # The visitor table only depends on the class, so build it once
+        cls = type(self)
+        if '_VISITORS' not in cls.__dict__:
+            cls._VISITORS = cls._build_visitors()
+    
+    @classmethod
+    def _build_visitors(cls) -> Dict[type, Callable[[Any, ast.AST], Any]]:
+        """
+        Map each AST node type to its visit_* function.
+        
+        visit() then needs one dict lookup per node instead of
+        NodeVisitor's per-node name formatting and getattr.
+        """
+        return {
+            getattr(ast, name[6:]): getattr(cls, name)
+            for name in dir(cls)
+            if name.startswith('visit_') and isinstance(getattr(ast, name[6:], None), type)
+        }
+    
+    def visit(self, node: ast.AST) -> Any:
+        """Visit a node with its visit_* method, or generic_visit if it has none."""
+        visitor = self._VISITORS.get(type(node))
+        if visitor is None:
+            return self.generic_visit(node)
+        return visitor(self, node)
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit the children of a node that has no visit_* method."""
+        fields = self._STMT_ONLY_FIELDS.get(type(node))
+        if fields is None:
+            super().generic_visit(node)
+            return
+        
+        visit = self.visit
+        for field in fields:
+            for child in getattr(node, field):
+                visit(child)
+    
+    def _visit_statements(self, stmts: List[ast.stmt]) -> None:
+        """
+        Visit a run of statements in order.
+        
+        The loop looks each statement's visitor up in the table directly
+        instead of going through visit() once per statement.
+        """
+        visitors = self._VISITORS
+        generic_visit = self.generic_visit
+        for stmt in stmts:
+            visitor = visitors.get(type(stmt))
+            if visitor is None:
+                generic_visit(stmt)
+            else:
+                visitor(self, stmt)
     
     def _get_or_create_broadcast(self, name: str) -> str:
         """Get or create a broadcast ID for a message name."""
@@ -382,7 +527,7 @@ class ScratchTranspiler(ast.NodeVisitor):
             self.broadcast_ids[name] = self._generate_id()
         return self.broadcast_ids[name]
     
-    def _get_or_create_list(self, name: str, initial_items: List = None) -> str:
+    def _get_or_create_list(self, name: str, initial_items: Optional[List[Any]] = None) -> str:
         """Get or create a list ID for a list name."""
         if name not in self.list_ids:
             list_id = self._generate_id()
@@ -404,16 +549,11 @@ class ScratchTranspiler(ast.NodeVisitor):
         list_id = self._get_or_create_list(list_name)
         
         reporter_id = self._generate_id()
-        reporter_block = {
-            "opcode": "data_listcontents",
-            "next": None,
-            "parent": None,
-            "inputs": {},
-            "fields": {
-                "LIST": [list_name, list_id]
-            },
-            "shadow": False,
-            "topLevel": False,
+        reporter_block = self._BLOCK_TEMPLATE.copy()
+        reporter_block["opcode"] = "data_listcontents"
+        reporter_block["inputs"] = {}
+        reporter_block["fields"] = {
+            "LIST": [list_name, list_id]
         }
         self.blocks[reporter_id] = reporter_block
         return reporter_id
@@ -467,24 +607,29 @@ class ScratchTranspiler(ast.NodeVisitor):
         prototype_id = self._generate_id()
         
         # Create argument reporter blocks (these go in the prototype's inputs)
+        generate_id = self._generate_id
+        blocks = self.blocks
+        block_template = self._BLOCK_TEMPLATE
         argument_inputs = {}
-        for i, (arg_name, arg_id) in enumerate(zip(arg_names, arg_ids)):
+        for arg_name, arg_id in zip(arg_names, arg_ids):
             # Create the argument reporter block
-            arg_reporter_id = self._generate_id()
-            arg_reporter = {
-                "opcode": "argument_reporter_string_number",
-                "next": None,
-                "parent": prototype_id,
-                "inputs": {},
-                "fields": {
-                    "VALUE": [arg_name, None]
-                },
-                "shadow": True,
-                "topLevel": False,
+            arg_reporter_id = generate_id()
+            arg_reporter = block_template.copy()
+            arg_reporter["opcode"] = "argument_reporter_string_number"
+            arg_reporter["parent"] = prototype_id
+            arg_reporter["inputs"] = {}
+            arg_reporter["fields"] = {
+                "VALUE": [arg_name, None]
             }
-            self.blocks[arg_reporter_id] = arg_reporter
+            arg_reporter["shadow"] = True
+            blocks[arg_reporter_id] = arg_reporter
             argument_inputs[arg_id] = [1, arg_reporter_id]
         
+        # Mutation strings are compact JSON, as Scratch itself writes them;
+        # argumentids is kept for the procedures_call blocks
+        dumps = json.dumps
+        argumentids_json = dumps(arg_ids, separators=(',', ':'))
+        
         # Create the prototype block
         prototype = {
             "opcode": "procedures_prototype",
@@ -498,9 +643,9 @@ class ScratchTranspiler(ast.NodeVisitor):
                 "tagName": "mutation",
                 "children": [],
                 "proccode": proccode,
-                "argumentids": json.dumps(arg_ids),
-                "argumentnames": json.dumps(arg_names),
-                "argumentdefaults": json.dumps(arg_defaults),
+                "argumentids": argumentids_json,
+                "argumentnames": dumps(arg_names, separators=(',', ':')),
+                "argumentdefaults": dumps(arg_defaults, separators=(',', ':')),
                 "warp": "false"
             }
         }
@@ -528,7 +673,8 @@ class ScratchTranspiler(ast.NodeVisitor):
             "argument_ids": arg_ids,
             "argument_names": arg_names,
             "definition_id": definition_id,
-            "prototype_id": prototype_id
+            "prototype_id": prototype_id,
+            "_argumentids_json": argumentids_json
         }
         
         # Set up the hat block context
@@ -539,15 +685,14 @@ class ScratchTranspiler(ast.NodeVisitor):
         self._current_proc_args = dict(zip(arg_names, arg_ids))
         
         # Visit all statements in the function body
-        for stmt in node.body:
-            self.visit(stmt)
+        self._visit_statements(node.body)
         
         # Clean up
         self._current_proc_args = {}
         self.previous_block_id = None
         self.hat_block_id = None
     
-    def _create_procedure_call(self, proc_name: str, call_args: List[Any]) -> str:
+    def _create_procedure_call(self, proc_name: str, call_args: List[Any]) -> Optional[str]:
         """
         Create a procedures_call block for calling a custom block.
         
@@ -568,25 +713,48 @@ class ScratchTranspiler(ast.NodeVisitor):
         
         # Build inputs for each argument
         inputs = {}
-        for i, (arg_id, arg_val) in enumerate(zip(proc_info["argument_ids"], call_args)):
+        for arg_id, arg_val in zip(proc_info["argument_ids"], call_args):
             inputs.update(self._create_literal_input(arg_val, arg_id, call_id))
         
+        # Calls made before the definition is visited only have the
+        # pre-registered info, so serialize the argument IDs once here
+        argumentids_json = proc_info.get("_argumentids_json")
+        if argumentids_json is None:
+            argumentids_json = json.dumps(proc_info["argument_ids"], separators=(',', ':'))
+            proc_info["_argumentids_json"] = argumentids_json
+        
         self.blocks[call_id]["inputs"] = inputs
         self.blocks[call_id]["mutation"] = {
             "tagName": "mutation",
             "children": [],
             "proccode": proc_info["proccode"],
-            "argumentids": json.dumps(proc_info["argument_ids"]),
+            "argumentids": argumentids_json,
             "warp": "false"
         }
         
         return call_id
         
     def _generate_id(self) -> str:
-        """Generate a unique block ID using uuid."""
-        return str(uuid.uuid4()).replace('-', '')[:20]
+        """
+        Generate a unique block ID.
+        
+        IDs only need to be unique within a project, so they are a counter
+        written in base 62: a few characters each instead of Scratch's 20,
+        which keeps project.json small. The first character is always a
+        letter: JavaScript orders integer-like object keys first, so an
+        all-digit ID would change the order Scratch loads blocks in.
+        """
+        self._id_counter += 1
+        n, first = divmod(self._id_counter, 52)
+        alphabet = self._ID_ALPHABET
+        chars = [alphabet[first]]
+        while n:
+            n, digit = divmod(n, 62)
+            chars.append(alphabet[digit])
+        return ''.join(chars)
     
-    def _create_literal_input(self, value: Any, input_name: str, parent_block_id: str = None) -> Dict[str, Any]:
+    def _create_literal_input(self, value: Any, input_name: str,
+                              parent_block_id: Optional[str] = None) -> Dict[str, List[Any]]:
         """
         Create a Scratch input field for a literal value or variable reference.
         
@@ -597,9 +765,10 @@ class ScratchTranspiler(ast.NodeVisitor):
         
         For variables, we create a reporter block and reference it.
         """
-        # Check if this is a variable reference (tuple marker from _extract_value)
-        if isinstance(value, tuple) and len(value) == 2 and value[0] == '__VAR__':
-            var_name = value[1]
+        value_type = type(value)
+        # Check if this is a variable reference (marker from _extract_value)
+        if value_type is _VarRef:
+            var_name = value.name
             # Create a variable reporter block
             reporter_id = self._create_variable_reporter(var_name)
             # Set parent if provided
@@ -607,19 +776,22 @@ class ScratchTranspiler(ast.NodeVisitor):
                 self.blocks[reporter_id]["parent"] = parent_block_id
             # Return block reference format: [3, block_id, [default_value]]
             # Using [3, block_id, [4, "0"]] for a number with shadow
-            return {input_name: [3, reporter_id, [4, "0"]]}
-        elif isinstance(value, tuple) and len(value) == 2 and value[0] == '__BLOCK__':
+            return {input_name: [3, reporter_id, self._DEFAULT_NUM_SHADOW]}
+        elif value_type is _BlockRef:
             # This is a reference to an already-created block (e.g., BinOp result)
-            block_id = value[1]
+            block_id = value.block_id
             if parent_block_id:
                 self.blocks[block_id]["parent"] = parent_block_id
-            return {input_name: [3, block_id, [4, "0"]]}
+            return {input_name: [3, block_id, self._DEFAULT_NUM_SHADOW]}
         elif isinstance(value, (int, float)):
             # Number input: [1, [4, "value"]]
+            # (bool is an int subclass but must still become "True"/"False")
+            if type(value) is int and self._SMALL_INT_MIN <= value <= self._SMALL_INT_MAX:
+                return {input_name: [1, [4, self._SMALL_INT_STRS[value - self._SMALL_INT_MIN]]]}
             return {input_name: [1, [4, str(value)]]}
         else:
             # String input: [1, [10, "value"]]
-            return {input_name: [1, [10, str(value)]]}
+            return {input_name: [1, [10, value if type(value) is str else str(value)]]}
     
     def _get_or_create_variable(self, var_name: str, initial_value: Any = 0) -> str:
         """
@@ -649,26 +821,26 @@ class ScratchTranspiler(ast.NodeVisitor):
         Returns:
             The block ID of the variable reporter
         """
-        var_id = self._get_or_create_variable(var_name)
+        # Reporters for the same variable only differ in their ID and
+        # parent, so the block is built once per variable and copied
+        template = self._var_reporter_templates.get(var_name)
+        if template is None:
+            var_id = self._get_or_create_variable(var_name)
+            template = self._BLOCK_TEMPLATE.copy()
+            template["opcode"] = "data_variable"
+            template["fields"] = {
+                "VARIABLE": [var_name, var_id]
+            }
+            self._var_reporter_templates[var_name] = template
         
         block_id = self._generate_id()
-        
-        block = {
-            "opcode": "data_variable",
-            "next": None,
-            "parent": None,
-            "inputs": {},
-            "fields": {
-                "VARIABLE": [var_name, var_id]
-            },
-            "shadow": False,
-            "topLevel": False,
-        }
+        block = template.copy()
+        block["inputs"] = {}
         
         self.blocks[block_id] = block
         return block_id
     
-    def _create_block(self, opcode: str, inputs: Dict = None, 
+    def _create_block(self, opcode: str, inputs: Optional[Dict[str, List[Any]]] = None,
                       top_level: bool = False, is_hat: bool = False,
                       is_reporter: bool = False) -> str:
         """
@@ -686,40 +858,35 @@ class ScratchTranspiler(ast.NodeVisitor):
         """
         block_id = self._generate_id()
         
-        block = {
-            "opcode": opcode,
-            "next": None,
-            "parent": None,
-            "inputs": inputs or {},
-            "fields": {},
-            "shadow": False,
-            "topLevel": top_level,
-        }
+        block = self._BLOCK_TEMPLATE.copy()
+        block["opcode"] = opcode
+        block["inputs"] = inputs or {}
+        block["fields"] = {}
+        block["topLevel"] = top_level
         
         # Hat blocks need x, y coordinates
         if top_level:
             block["x"] = 0
             block["y"] = 0
         
+        blocks = self.blocks
+        blocks[block_id] = block
+        
         # Reporter blocks don't participate in the linked list
         if not is_reporter:
             # Link to previous block (linked list logic)
-            if self.previous_block_id is not None:
+            previous_id = self.previous_block_id
+            if previous_id is not None:
                 # Set this block's parent to the previous block
-                block["parent"] = self.previous_block_id
+                block["parent"] = previous_id
                 # Set the previous block's next to this block
-                self.blocks[self.previous_block_id]["next"] = block_id
-        
-        self.blocks[block_id] = block
-        
-        # Update tracking for linked list (only for stack blocks)
-        if not is_reporter:
-            if not is_hat:
-                self.previous_block_id = block_id
-            else:
+                blocks[previous_id]["next"] = block_id
+            
+            # Update tracking for linked list (only for stack blocks)
+            if is_hat:
                 # Hat block becomes the parent for following blocks
                 self.hat_block_id = block_id
-                self.previous_block_id = block_id
+            self.previous_block_id = block_id
             
         return block_id
     
@@ -823,10 +990,9 @@ class ScratchTranspiler(ast.NodeVisitor):
             return not_block_id
         
         # Standard operators
-        if op_type not in self.COMPARE_MAP:
+        opcode = self.COMPARE_MAP.get(op_type)
+        if opcode is None:
             return None
-            
-        opcode = self.COMPARE_MAP[op_type]
         
         # Create the comparison block first so we have its ID for parenting
         block_id = self._create_block(opcode=opcode, inputs={}, is_reporter=True)
@@ -851,12 +1017,9 @@ class ScratchTranspiler(ast.NodeVisitor):
         Returns:
             The block ID of the operator block
         """
-        op_type = type(node.op)
-        
-        if op_type not in self.BINOP_MAP:
+        opcode = self.BINOP_MAP.get(type(node.op))
+        if opcode is None:
             return None
-            
-        opcode = self.BINOP_MAP[op_type]
         
         # Extract left and right operands
         left_value = self._extract_value(node.left)
@@ -929,7 +1092,7 @@ class ScratchTranspiler(ast.NodeVisitor):
         """
         Extract a value from an AST node - handles literals, variables, and expressions.
         
-        Returns a marker tuple for special values, or the literal value directly.
+        Returns a _VarRef/_BlockRef marker for special values, or the literal value directly.
         """
         if isinstance(node, ast.Constant):
             return node.value
@@ -948,17 +1111,17 @@ class ScratchTranspiler(ast.NodeVisitor):
             return 0
         elif isinstance(node, ast.Name):
             # This is a variable reference - return a special marker
-            return ('__VAR__', node.id)
+            return _VarRef(node.id)
         elif isinstance(node, ast.BinOp):
             # This is a binary operation - create the block and return a reference
             block_id = self.visit_BinOp(node)
-            return ('__BLOCK__', block_id)
+            return _BlockRef(block_id)
         elif isinstance(node, ast.Call):
             # This could be a reporter function like x_position(), pick_random(), etc.
             # Try to visit it as a call - if it returns a block_id, use that
             block_id = self.visit_Call(node)
             if block_id:
-                return ('__BLOCK__', block_id)
+                return _BlockRef(block_id)
             return 0
         else:
             return 0
@@ -980,7 +1143,7 @@ class ScratchTranspiler(ast.NodeVisitor):
         
         # Determine initial value for variable definition
         # Use 0 as default for any non-literal values
-        if isinstance(value, tuple):
+        if isinstance(value, (_VarRef, _BlockRef)):
             initial_value = 0  # Variable, block reference, or expression
         elif isinstance(value, (int, float)):
             initial_value = value
@@ -1043,13 +1206,13 @@ class ScratchTranspiler(ast.NodeVisitor):
             if isinstance(value, (int, float)):
                 value = -value
                 value_input = self._create_literal_input(value, 'VALUE', block_id)
-            elif isinstance(value, tuple) and value[0] == '__BLOCK__':
+            elif type(value) is _BlockRef:
                 # For block references, wrap in operator_subtract from 0
                 subtract_id = self._create_block(opcode='operator_subtract', inputs={}, is_reporter=True)
-                self.blocks[subtract_id]["inputs"]["NUM1"] = [1, [4, "0"]]
-                self.blocks[subtract_id]["inputs"]["NUM2"] = [3, value[1], [4, "0"]]
-                self.blocks[value[1]]["parent"] = subtract_id
-                value_input = {"VALUE": [3, subtract_id, [4, "0"]]}
+                self.blocks[subtract_id]["inputs"]["NUM1"] = [1, self._DEFAULT_NUM_SHADOW]
+                self.blocks[subtract_id]["inputs"]["NUM2"] = [3, value.block_id, self._DEFAULT_NUM_SHADOW]
+                self.blocks[value.block_id]["parent"] = subtract_id
+                value_input = {"VALUE": [3, subtract_id, self._DEFAULT_NUM_SHADOW]}
             else:
                 value_input = self._create_literal_input(value, 'VALUE', block_id)
             
@@ -1423,6 +1586,7 @@ class ScratchTranspiler(ast.NodeVisitor):
         saved_blocks = self.blocks
         saved_variables = self.variable_definitions
         saved_var_ids = self.variable_ids
+        saved_var_reporters = self._var_reporter_templates
         saved_previous = self.previous_block_id
         saved_hat = self.hat_block_id
         saved_custom_blocks = self.custom_blocks
@@ -1431,6 +1595,7 @@ class ScratchTranspiler(ast.NodeVisitor):
         self.blocks = {}
         self.variable_definitions = {}
         self.variable_ids = {}
+        self._var_reporter_templates = {}
         self.list_definitions = {}
         self.list_ids = {}
         self.custom_blocks = {}
@@ -1496,6 +1661,7 @@ class ScratchTranspiler(ast.NodeVisitor):
         self.blocks = saved_blocks
         self.variable_definitions = saved_variables
         self.variable_ids = saved_var_ids
+        self._var_reporter_templates = saved_var_reporters
         self.previous_block_id = saved_previous
         self.hat_block_id = saved_hat
         self.custom_blocks = saved_custom_blocks
@@ -1519,8 +1685,7 @@ class ScratchTranspiler(ast.NodeVisitor):
             )
             
             # Visit all statements in the function body
-            for stmt in node.body:
-                self.visit(stmt)
+            self._visit_statements(node.body)
                 
             # Reset for potential next script
             self.previous_block_id = None
@@ -1543,8 +1708,7 @@ class ScratchTranspiler(ast.NodeVisitor):
             )
             self.blocks[block_id]["fields"]["KEY_OPTION"] = [key_value, None]
             
-            for stmt in node.body:
-                self.visit(stmt)
+            self._visit_statements(node.body)
             
             self.previous_block_id = None
             self.hat_block_id = None
@@ -1557,8 +1721,7 @@ class ScratchTranspiler(ast.NodeVisitor):
                 is_hat=True
             )
             
-            for stmt in node.body:
-                self.visit(stmt)
+            self._visit_statements(node.body)
             
             self.previous_block_id = None
             self.hat_block_id = None
@@ -1571,8 +1734,7 @@ class ScratchTranspiler(ast.NodeVisitor):
                 is_hat=True
             )
             
-            for stmt in node.body:
-                self.visit(stmt)
+            self._visit_statements(node.body)
             
             self.previous_block_id = None
             self.hat_block_id = None
@@ -1590,8 +1752,7 @@ class ScratchTranspiler(ast.NodeVisitor):
             )
             self.blocks[block_id]["fields"]["BACKDROP"] = [backdrop_name, None]
             
-            for stmt in node.body:
-                self.visit(stmt)
+            self._visit_statements(node.body)
             
             self.previous_block_id = None
             self.hat_block_id = None
@@ -1612,8 +1773,7 @@ class ScratchTranspiler(ast.NodeVisitor):
             )
             self.blocks[block_id]["fields"]["BROADCAST_OPTION"] = [message_name, broadcast_id]
             
-            for stmt in node.body:
-                self.visit(stmt)
+            self._visit_statements(node.body)
             
             self.previous_block_id = None
             self.hat_block_id = None
@@ -1634,8 +1794,7 @@ class ScratchTranspiler(ast.NodeVisitor):
             self.blocks[block_id]["fields"]["WHENGREATERTHANMENU"] = ["LOUDNESS", None]
             self.blocks[block_id]["inputs"]["VALUE"] = [1, [4, str(threshold_val)]]
             
-            for stmt in node.body:
-                self.visit(stmt)
+            self._visit_statements(node.body)
             
             self.previous_block_id = None
             self.hat_block_id = None
@@ -1656,8 +1815,7 @@ class ScratchTranspiler(ast.NodeVisitor):
             self.blocks[block_id]["fields"]["WHENGREATERTHANMENU"] = ["TIMER", None]
             self.blocks[block_id]["inputs"]["VALUE"] = [1, [4, str(threshold_val)]]
             
-            for stmt in node.body:
-                self.visit(stmt)
+            self._visit_statements(node.body)
             
             self.previous_block_id = None
             self.hat_block_id = None
@@ -1685,8 +1843,7 @@ class ScratchTranspiler(ast.NodeVisitor):
             )
             
             # Visit all statements in the function body
-            for stmt in node.body:
-                self.visit(stmt)
+            self._visit_statements(node.body)
                 
             # Reset for potential next script
             self.previous_block_id = None
@@ -1715,17 +1872,23 @@ class ScratchTranspiler(ast.NodeVisitor):
         """
         menu_id = self._generate_id()
         
-        menu_block = {
-            "opcode": menu_opcode,
-            "next": None,
-            "parent": parent_id,
-            "inputs": {},
-            "fields": {
+        # Scratch needs a separate shadow block under every parent, but
+        # identical menus only differ in ID and parent, so each distinct
+        # menu is built once and copied
+        key = (menu_opcode, field_name, value)
+        template = self._menu_templates.get(key)
+        if template is None:
+            template = self._BLOCK_TEMPLATE.copy()
+            template["opcode"] = menu_opcode
+            template["fields"] = {
                 field_name: [value, None]
-            },
-            "shadow": True,
-            "topLevel": False,
-        }
+            }
+            template["shadow"] = True
+            self._menu_templates[key] = template
+        
+        menu_block = template.copy()
+        menu_block["parent"] = parent_id
+        menu_block["inputs"] = {}
         
         self.blocks[menu_id] = menu_block
         return menu_id
@@ -1748,175 +1911,183 @@ class ScratchTranspiler(ast.NodeVisitor):
         }
         return target_map.get(target_str.lower(), target_str)
     
-    def visit_Call(self, node: ast.Call) -> Any:
-        """
-        Visit a function call and convert to appropriate Scratch block.
-        
-        Handles all motion blocks, looks blocks, and other mapped functions.
-        Returns block_id for reporter functions, None otherwise.
-        """
-        # Get the function name
-        if isinstance(node.func, ast.Name):
-            func_name = node.func.id
-        elif isinstance(node.func, ast.Attribute):
-            # Handle method calls like self.mouse_down()
-            func_name = node.func.attr
-        else:
-            # Unknown function type
-            return None
-        
-        # === Reporter functions (return a value) ===
-        if func_name in self.REPORTER_MAP:
-            opcode = self.REPORTER_MAP[func_name]
-            block_id = self._create_block(opcode=opcode, inputs={}, is_reporter=True)
-            return block_id
+    def _call_reporter(self, node: ast.Call, func_name: str, opcode: str) -> str:
+        """Create a reporter or boolean reporter block (REPORTER_MAP, BOOLEAN_REPORTER_MAP)."""
+        return self._create_block(opcode=opcode, inputs={}, is_reporter=True)
+    
+    def _call_field_reporter(self, node: ast.Call, func_name: str, mapping: Tuple) -> str:
+        """Create a field-based reporter such as costume_number (FIELD_REPORTER_MAP)."""
+        opcode, field_name, field_value = mapping
+        block_id = self._create_block(opcode=opcode, inputs={}, is_reporter=True)
+        self.blocks[block_id]["fields"][field_name] = [field_value, None]
+        return block_id
+    
+    def _call_single_arg(self, node: ast.Call, func_name: str, mapping: Tuple) -> None:
+        """Create a simple single-argument block (FUNCTION_MAP)."""
+        opcode, input_name = mapping
+        
+        # Create the block first so we have its ID
+        block_id = self._create_block(opcode=opcode, inputs={})
+        
+        # Get the argument value and create input
+        if node.args:
+            arg = node.args[0]
+            value = self._extract_value(arg)
+            inputs = self._create_literal_input(value, input_name, block_id)
+            self.blocks[block_id]["inputs"] = inputs
+    
+    def _call_multi_arg(self, node: ast.Call, func_name: str, mapping: Tuple) -> None:
+        """Create a multi-argument block (MULTI_ARG_MAP)."""
+        opcode, input_names = mapping
         
-        # === Boolean reporter functions (return True/False) ===
-        if func_name in self.BOOLEAN_REPORTER_MAP:
-            opcode = self.BOOLEAN_REPORTER_MAP[func_name]
-            block_id = self._create_block(opcode=opcode, inputs={}, is_reporter=True)
-            return block_id
+        # Create the block
+        block_id = self._create_block(opcode=opcode, inputs={})
         
-        # === Field-based reporters (costume_number, backdrop_number, etc.) ===
-        if func_name in self.FIELD_REPORTER_MAP:
-            opcode, field_name, field_value = self.FIELD_REPORTER_MAP[func_name]
-            block_id = self._create_block(opcode=opcode, inputs={}, is_reporter=True)
-            self.blocks[block_id]["fields"][field_name] = [field_value, None]
-            return block_id
+        # Process each argument
+        inputs = {}
+        for input_name, arg in zip(input_names, node.args):
+            value = self._extract_value(arg)
+            inputs.update(self._create_literal_input(value, input_name, block_id))
         
-        # === Simple single-argument functions ===
-        if func_name in self.FUNCTION_MAP:
-            opcode, input_name = self.FUNCTION_MAP[func_name]
-            
-            # Create the block first so we have its ID
-            block_id = self._create_block(opcode=opcode, inputs={})
-            
-            # Get the argument value and create input
-            if node.args:
-                arg = node.args[0]
-                value = self._extract_value(arg)
-                inputs = self._create_literal_input(value, input_name, block_id)
-                self.blocks[block_id]["inputs"] = inputs
-            return None
+        self.blocks[block_id]["inputs"] = inputs
+    
+    def _call_no_arg(self, node: ast.Call, func_name: str, opcode: str) -> None:
+        """Create a block that takes no arguments (NO_ARG_MAP)."""
+        self._create_block(opcode=opcode, inputs={})
+    
+    def _call_field_input(self, node: ast.Call, func_name: str, mapping: Tuple) -> None:
+        """Create an effect or layer block with a field and an input (FIELD_INPUT_MAP)."""
+        opcode, field_name, input_name, valid_values = mapping
+        
+        # Create the block
+        block_id = self._create_block(opcode=opcode, inputs={})
+        
+        # First arg is the field value (string)
+        if len(node.args) >= 1:
+            field_value = self._extract_value(node.args[0])
+            if isinstance(field_value, str):
+                field_value = field_value.upper()  # Scratch expects uppercase effect names
+            if not isinstance(field_value, (_VarRef, _BlockRef)):
+                self.blocks[block_id]["fields"][field_name] = [field_value, None]
         
-        # === Multi-argument functions ===
-        if func_name in self.MULTI_ARG_MAP:
-            opcode, input_names = self.MULTI_ARG_MAP[func_name]
-            
-            # Create the block
-            block_id = self._create_block(opcode=opcode, inputs={})
-            
-            # Process each argument
-            inputs = {}
-            for i, input_name in enumerate(input_names):
-                if i < len(node.args):
-                    value = self._extract_value(node.args[i])
-                    inputs.update(self._create_literal_input(value, input_name, block_id))
-            
+        # Second arg is the input value (number)
+        if len(node.args) >= 2:
+            input_value = self._extract_value(node.args[1])
+            inputs = self._create_literal_input(input_value, input_name, block_id)
             self.blocks[block_id]["inputs"] = inputs
-            return None
-        
-        # === No-argument functions ===
-        if func_name in self.NO_ARG_MAP:
-            opcode = self.NO_ARG_MAP[func_name]
-            self._create_block(opcode=opcode, inputs={})
-            return None
+    
+    def _call_menu(self, node: ast.Call, func_name: str, mapping: Tuple) -> None:
+        """Create a block whose target comes from a dropdown menu (MENU_FUNCTION_MAP)."""
+        opcode, input_name, menu_opcode, menu_field = mapping
         
-        # === Field+Input functions (effect blocks, layer changes) ===
-        if func_name in self.FIELD_INPUT_MAP:
-            opcode, field_name, input_name, valid_values = self.FIELD_INPUT_MAP[func_name]
-            
-            # Create the block
+        # For glide_to, first arg is SECS, second is target
+        if func_name == 'glide_to':
+            # Create the main block
             block_id = self._create_block(opcode=opcode, inputs={})
             
-            # First arg is the field value (string)
+            # First arg is SECS
             if len(node.args) >= 1:
-                field_value = self._extract_value(node.args[0])
-                if isinstance(field_value, str):
-                    field_value = field_value.upper()  # Scratch expects uppercase effect names
-                self.blocks[block_id]["fields"][field_name] = [field_value, None]
+                secs_value = self._extract_value(node.args[0])
+                secs_input = self._create_literal_input(secs_value, 'SECS', block_id)
+                self.blocks[block_id]["inputs"].update(secs_input)
             
-            # Second arg is the input value (number)
+            # Second arg is target
             if len(node.args) >= 2:
-                input_value = self._extract_value(node.args[1])
-                inputs = self._create_literal_input(input_value, input_name, block_id)
-                self.blocks[block_id]["inputs"] = inputs
-            
-            return None
-        
-        # === Menu-based functions (go_to, glide_to, point_towards) ===
-        if func_name in self.MENU_FUNCTION_MAP:
-            opcode, input_name, menu_opcode, menu_field = self.MENU_FUNCTION_MAP[func_name]
-            
-            # For glide_to, first arg is SECS, second is target
-            if func_name == 'glide_to':
-                # Create the main block
-                block_id = self._create_block(opcode=opcode, inputs={})
+                target_value = self._extract_value(node.args[1])
+                if isinstance(target_value, str):
+                    target_value = self._handle_motion_target(target_value)
                 
-                # First arg is SECS
-                if len(node.args) >= 1:
-                    secs_value = self._extract_value(node.args[0])
-                    secs_input = self._create_literal_input(secs_value, 'SECS', block_id)
-                    self.blocks[block_id]["inputs"].update(secs_input)
+                menu_id = self._create_menu_block(menu_opcode, menu_field,
+                                                  str(target_value), block_id)
+                self.blocks[block_id]["inputs"][input_name] = [1, menu_id]
+        else:
+            # go_to, point_towards, play_sound, switch_costume, etc. - single target argument
+            block_id = self._create_block(opcode=opcode, inputs={})
+            
+            if node.args:
+                target_value = self._extract_value(node.args[0])
                 
-                # Second arg is target
-                if len(node.args) >= 2:
-                    target_value = self._extract_value(node.args[1])
+                # Check if this is a block reference (expression like letter_of)
+                if type(target_value) is _BlockRef:
+                    # Use the reporter block directly instead of a menu
+                    reporter_block_id = target_value.block_id
+                    self.blocks[reporter_block_id]["parent"] = block_id
+                    self.blocks[block_id]["inputs"][input_name] = [3, reporter_block_id, self._EMPTY_TEXT_SHADOW]
+                elif type(target_value) is _VarRef:
+                    # Variable reference - create variable input
+                    var_name = target_value.name
+                    var_id = self._get_or_create_variable(var_name)
+                    self.blocks[block_id]["inputs"][input_name] = [3, [12, var_name, var_id], self._EMPTY_TEXT_SHADOW]
+                else:
                     if isinstance(target_value, str):
-                        target_value = self._handle_motion_target(target_value)
+                        # For motion blocks, handle special targets
+                        if func_name in ('go_to', 'point_towards'):
+                            target_value = self._handle_motion_target(target_value)
+                        # For sound blocks, track the sound name
+                        elif func_name in ('play_sound', 'start_sound', 'play_sound_until_done'):
+                            self.sounds_used.add(target_value)
                     
                     menu_id = self._create_menu_block(menu_opcode, menu_field,
                                                       str(target_value), block_id)
                     self.blocks[block_id]["inputs"][input_name] = [1, menu_id]
-            else:
-                # go_to, point_towards, play_sound, switch_costume, etc. - single target argument
-                block_id = self._create_block(opcode=opcode, inputs={})
-                
-                if node.args:
-                    target_value = self._extract_value(node.args[0])
-                    
-                    # Check if this is a block reference (expression like letter_of)
-                    if isinstance(target_value, tuple) and target_value[0] == '__BLOCK__':
-                        # Use the reporter block directly instead of a menu
-                        reporter_block_id = target_value[1]
-                        self.blocks[reporter_block_id]["parent"] = block_id
-                        self.blocks[block_id]["inputs"][input_name] = [3, reporter_block_id, [10, ""]]
-                    elif isinstance(target_value, tuple) and target_value[0] == '__VAR__':
-                        # Variable reference - create variable input
-                        var_name = target_value[1]
-                        var_id = self._get_or_create_variable(var_name)
-                        self.blocks[block_id]["inputs"][input_name] = [3, [12, var_name, var_id], [10, ""]]
-                    else:
-                        if isinstance(target_value, str):
-                            # For motion blocks, handle special targets
-                            if func_name in ('go_to', 'point_towards'):
-                                target_value = self._handle_motion_target(target_value)
-                            # For sound blocks, track the sound name
-                            elif func_name in ('play_sound', 'start_sound', 'play_sound_until_done'):
-                                self.sounds_used.add(target_value)
-                        
-                        menu_id = self._create_menu_block(menu_opcode, menu_field,
-                                                          str(target_value), block_id)
-                        self.blocks[block_id]["inputs"][input_name] = [1, menu_id]
-            
-            return None
+    
+    def _call_field(self, node: ast.Call, func_name: str, mapping: Tuple) -> None:
+        """Create a block whose argument is a field, like rotation style (FIELD_FUNCTION_MAP)."""
+        opcode, field_name, valid_values = mapping
+        
+        # Create the block
+        block_id = self._create_block(opcode=opcode, inputs={})
+        
+        # Get the style argument
+        if node.args:
+            style_value = self._extract_value(node.args[0])
+            # Validate and set the field
+            if isinstance(style_value, str):
+                self.blocks[block_id]["fields"][field_name] = [style_value, None]
+    
+    # Function name -> (handler, mapping entry) for every name in the mapping
+    # tables, so visit_Call finds the handler with one lookup. Each name may
+    # appear in only one table.
+    _DISPATCH = {}
+    for _handler, _table in (
+        (_call_reporter, REPORTER_MAP),
+        (_call_reporter, BOOLEAN_REPORTER_MAP),
+        (_call_field_reporter, FIELD_REPORTER_MAP),
+        (_call_single_arg, FUNCTION_MAP),
+        (_call_multi_arg, MULTI_ARG_MAP),
+        (_call_no_arg, NO_ARG_MAP),
+        (_call_field_input, FIELD_INPUT_MAP),
+        (_call_menu, MENU_FUNCTION_MAP),
+        (_call_field, FIELD_FUNCTION_MAP),
+    ):
+        for _name, _mapping in _table.items():
+            assert _name not in _DISPATCH, f"{_name!r} is in more than one mapping table"
+            _DISPATCH[_name] = (_handler, _mapping)
+    del _handler, _table, _name, _mapping
+    
+    def visit_Call(self, node: ast.Call) -> Any:
+        """
+        Visit a function call and convert to appropriate Scratch block.
         
-        # === Field-based functions (set_rotation_style) ===
-        if func_name in self.FIELD_FUNCTION_MAP:
-            opcode, field_name, valid_values = self.FIELD_FUNCTION_MAP[func_name]
-            
-            # Create the block
-            block_id = self._create_block(opcode=opcode, inputs={})
-            
-            # Get the style argument
-            if node.args:
-                style_value = self._extract_value(node.args[0])
-                # Validate and set the field
-                if isinstance(style_value, str):
-                    self.blocks[block_id]["fields"][field_name] = [style_value, None]
-            
+        Handles all motion blocks, looks blocks, and other mapped functions.
+        Returns block_id for reporter functions, None otherwise.
+        """
+        # Get the function name
+        if isinstance(node.func, ast.Name):
+            func_name = node.func.id
+        elif isinstance(node.func, ast.Attribute):
+            # Handle method calls like self.mouse_down()
+            func_name = node.func.attr
+        else:
+            # Unknown function type
             return None
         
+        # === Functions from the mapping tables (see _DISPATCH) ===
+        entry = self._DISPATCH.get(func_name)
+        if entry is not None:
+            handler, payload = entry
+            return handler(self, node, func_name, payload)
+        
         # === Broadcast functions (need special handling for broadcast IDs) ===
         if func_name == 'broadcast':
             if node.args:
@@ -2303,12 +2474,14 @@ class ScratchTranspiler(ast.NodeVisitor):
         
         return None
 
-    def transpile(self, source_code: str) -> List[Dict[str, Any]]:
+    def transpile(self, source_code: Union[str, bytes], filename: str = '<unknown>') -> List[Dict[str, Any]]:
         """
         Transpile Python source code to Scratch targets (sprites).
         
         Args:
-            source_code: Python source code string
+            source_code: Python source code, as a string or as raw bytes
+                         (decoded by the parser, honouring coding cookies)
+            filename: File name reported in syntax errors
             
         Returns:
             List of target dictionaries, each containing:
@@ -2325,6 +2498,7 @@ class ScratchTranspiler(ast.NodeVisitor):
         self.previous_block_id = None
         self.hat_block_id = None
         self.variable_ids = {}
+        self._var_reporter_templates = {}
         self.variable_definitions = {}
         self.list_ids = {}
         self.list_definitions = {}
@@ -2339,7 +2513,7 @@ class ScratchTranspiler(ast.NodeVisitor):
         self.stage_config = None
         
         # Parse the Python code into an AST
-        tree = ast.parse(source_code)
+        tree = ast.parse(source_code, filename=filename)
         
         # Extract stage configuration if configure_stage() was called
         self.stage_config = self._extract_stage_config(tree)
@@ -2437,17 +2611,17 @@ def create_project_json(transpile_result: Any = None, base_path: str = None) ->
             for bd_info in stage_config['backdrops']:
                 try:
                     if bd_info.get('svg_string'):
-                        bd_dict, bd_data = load_backdrop_from_svg(
+                        bd_asset, bd_data = load_backdrop_from_svg(
                             bd_info['name'], bd_info['svg_string']
                         )
                     elif bd_info.get('file_path'):
-                        bd_dict, bd_data = load_backdrop_from_file(
+                        bd_asset, bd_data = load_backdrop_from_file(
                             bd_info['name'], bd_info['file_path'], base_path
                         )
                     else:
                         continue
-                    backdrops.append(bd_dict)
-                    custom_assets[bd_dict['md5ext']] = bd_data
+                    backdrops.append(bd_asset.as_dict())
+                    custom_assets[bd_asset.md5ext] = bd_data
                 except Exception as e:
                     print(f"  Warning: Could not load backdrop '{bd_info.get('name')}': {e}")
         
@@ -2456,11 +2630,11 @@ def create_project_json(transpile_result: Any = None, base_path: str = None) ->
             for snd_info in stage_config['sounds']:
                 try:
                     if snd_info.get('file_path'):
-                        snd_dict, snd_data = load_sound_from_file(
+                        snd_asset, snd_data = load_sound_from_file(
                             snd_info['name'], snd_info['file_path'], base_path
                         )
-                        stage_sounds.append(snd_dict)
-                        custom_assets[snd_dict['md5ext']] = snd_data
+                        stage_sounds.append(snd_asset.as_dict())
+                        custom_assets[snd_asset.md5ext] = snd_data
                 except Exception as e:
                     print(f"  Warning: Could not load sound '{snd_info.get('name')}': {e}")
         
@@ -2512,13 +2686,13 @@ def create_project_json(transpile_result: Any = None, base_path: str = None) ->
                 for cos_info in sprite_config['costumes']:
                     try:
                         if cos_info.get('svg_string'):
-                            cos_dict, cos_data = load_costume_from_svg(
+                            cos_asset, cos_data = load_costume_from_svg(
                                 cos_info['name'], cos_info['svg_string'],
                                 cos_info.get('rotation_center_x'),
                                 cos_info.get('rotation_center_y')
                             )
                         elif cos_info.get('file_path'):
-                            cos_dict, cos_data = load_costume_from_file(
+                            cos_asset, cos_data = load_costume_from_file(
                                 cos_info['name'], cos_info['file_path'],
                                 cos_info.get('rotation_center_x'),
                                 cos_info.get('rotation_center_y'),
@@ -2526,8 +2700,8 @@ def create_project_json(transpile_result: Any = None, base_path: str = None) ->
                             )
                         else:
                             continue
-                        costumes.append(cos_dict)
-                        custom_assets[cos_dict['md5ext']] = cos_data
+                        costumes.append(cos_asset.as_dict())
+                        custom_assets[cos_asset.md5ext] = cos_data
                     except Exception as e:
                         print(f"  Warning: Could not load costume '{cos_info.get('name')}': {e}")
             
@@ -2537,11 +2711,11 @@ def create_project_json(transpile_result: Any = None, base_path: str = None) ->
                 for snd_info in sprite_config['sounds']:
                     try:
                         if snd_info.get('file_path'):
-                            snd_dict, snd_data = load_sound_from_file(
+                            snd_asset, snd_data = load_sound_from_file(
                                 snd_info['name'], snd_info['file_path'], base_path
                             )
-                            sounds.append(snd_dict)
-                            custom_assets[snd_dict['md5ext']] = snd_data
+                            sounds.append(snd_asset.as_dict())
+                            custom_assets[snd_asset.md5ext] = snd_data
                     except Exception as e:
                         print(f"  Warning: Could not load sound '{snd_info.get('name')}': {e}")
             
@@ -2645,21 +2819,24 @@ def create_project_json(transpile_result: Any = None, base_path: str = None) ->
     return project, custom_assets
 
 
-def transpile_to_json(source_code: str, indent: int = 2, base_path: str = None) -> Tuple[str, Dict[str, bytes]]:
+def transpile_to_json(source_code: Union[str, bytes], indent: int = 2, base_path: str = None,
+                      filename: str = '<unknown>') -> Tuple[str, Dict[str, bytes]]:
     """
     Main entry point: Transpile Python code to Scratch project.json string.
     
     Args:
-        source_code: Python source code to transpile
+        source_code: Python source code to transpile (str, or raw bytes
+                     as read from a .py file)
         indent: JSON indentation level (default: 2)
         base_path: Base path for resolving relative asset file paths
+        filename: File name reported in syntax errors
         
     Returns:
         Tuple of (json_string, custom_assets_dict)
         where custom_assets_dict maps md5ext -> bytes
     """
     transpiler = ScratchTranspiler()
-    result = transpiler.transpile(source_code)
+    result = transpiler.transpile(source_code, filename)
     project, custom_assets = create_project_json(result, base_path)
     return json.dumps(project, indent=indent), custom_assets
 
@@ -2797,7 +2974,7 @@ ASSET_ID_TO_EMBEDDED = {
     "cd21514d0531fdffb22204e0ec5ed84a": "backdrop1",
 }
 
-def save_sb3(json_content: str, filename: str = "output.sb3", source_sb3: str = None, 
+def save_sb3(json_content: Union[str, Dict[str, Any]], filename: str = "output.sb3", source_sb3: str = None, 
              custom_assets: Dict[str, bytes] = None) -> None:
     """
     Save the project.json as a .sb3 file (ZIP archive) with embedded assets.
@@ -2806,7 +2983,8 @@ def save_sb3(json_content: str, filename: str = "output.sb3", source_sb3: str =
     Falls back to embedded SVGs if library is unavailable.
     
     Args:
-        json_content: The project.json string
+        json_content: The project.json string, or the project dict itself
+                      (serialized straight into the archive)
         filename: Output filename (default: "output.sb3")
         source_sb3: Optional source .sb3 file to copy assets from (for round-trip)
         custom_assets: Dictionary mapping md5ext -> bytes for custom assets
@@ -2815,7 +2993,10 @@ def save_sb3(json_content: str, filename: str = "output.sb3", source_sb3: str =
         custom_assets = {}
     
     # Parse project.json to find all required assets
-    project_data = json.loads(json_content)
+    if isinstance(json_content, dict):
+        project_data = json_content
+    else:
+        project_data = json.loads(json_content)
     required_assets = set()
     
     for target in project_data.get("targets", []):
@@ -2839,31 +3020,61 @@ def save_sb3(json_content: str, filename: str = "output.sb3", source_sb3: str =
         except Exception as e:
             print(f"  Warning: Could not read source assets: {e}")
     
-    with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED) as zf:
+    try:
+        from .assets import is_precompressed
+    except ImportError:
+        def is_precompressed(md5ext: str) -> bool:
+            return False
+    
+    # Fetch the library assets up front, concurrently, instead of one
+    # blocking download at a time while writing the archive
+    library_assets = {}
+    if SPRITE_LIBRARY_AVAILABLE:
+        library_assets = prefetch_assets([
+            tuple(md5ext.rsplit('.', 1))
+            for md5ext in required_assets
+            if md5ext not in custom_assets and md5ext not in source_assets
+        ])
+    
+    # project.json is the bulk of the archive and is very repetitive, so
+    # the extra deflate effort at level 9 buys a noticeably smaller file
+    with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
         # Add the project.json
-        zf.writestr("project.json", json_content)
+        if isinstance(json_content, dict):
+            import io
+            
+            # Encode straight into the archive member rather than building
+            # the whole JSON string first
+            with zf.open("project.json", "w") as member:
+                with io.TextIOWrapper(member, encoding="utf-8", write_through=True) as stream:
+                    json.dump(json_content, stream, separators=(',', ':'))
+        else:
+            zf.writestr("project.json", json_content)
         
         # Add each required asset
         for md5ext in required_assets:
             asset_id, data_format = md5ext.rsplit('.', 1)
             
+            # Already-compressed formats (PNG, MP3, ...) are stored as-is
+            if is_precompressed(md5ext):
+                compress_type = zipfile.ZIP_STORED
+            else:
+                compress_type = zipfile.ZIP_DEFLATED
+            
             # First, check custom assets (from @sprite decorator or configure_stage)
             if md5ext in custom_assets:
-                zf.writestr(md5ext, custom_assets[md5ext])
+                zf.writestr(md5ext, custom_assets[md5ext], compress_type=compress_type)
                 continue
             
             # Next, try to get from source .sb3 (for round-trip)
             if md5ext in source_assets:
-                zf.writestr(md5ext, source_assets[md5ext])
+                zf.writestr(md5ext, source_assets[md5ext], compress_type=compress_type)
                 continue
             
-            # Try to get from sprite library cache
-            asset_data = None
-            if SPRITE_LIBRARY_AVAILABLE:
-                asset_data = get_cached_asset(asset_id, data_format)
-            
+            # Try the sprite library (prefetched above)
+            asset_data = library_assets.get(md5ext)
             if asset_data:
-                zf.writestr(md5ext, asset_data)
+                zf.writestr(md5ext, asset_data, compress_type=compress_type)
             else:
                 # Fallback: check if we have an embedded version
                 embedded_name = ASSET_ID_TO_EMBEDDED.get(asset_id)
@@ -4031,7 +4242,7 @@ def roundtrip_sb3(sb3_path: str, output_path: str = None, py_path: str = None) -
     # Step 3: Parse and merge with original project to preserve asset metadata
     # Load original project.json to get costume/backdrop/sound definitions
     with zipfile.ZipFile(sb3_path, 'r') as zf:
-        original_project = json.loads(zf.read('project.json').decode('utf-8'))
+        original_project = json.loads(zf.read('project.json'))
     
     new_project = json.loads(json_str)
     
@@ -4094,8 +4305,7 @@ def roundtrip_sb3(sb3_path: str, output_path: str = None, py_path: str = None) -
     new_project['meta'] = original_project.get('meta', new_project.get('meta', {}))
     
     # Step 4: Save with assets from original file
-    json_str = json.dumps(new_project)
-    save_sb3(json_str, output_path, source_sb3=sb3_path)
+    save_sb3(new_project, output_path, source_sb3=sb3_path)
     
     print(f"Round-trip: {sb3_path} -> {output_path}")
     return output_path
@@ -192,6 +192,16 @@ class Dog1:
         names = [t.get('name') for t in project['targets']]
         assert 'Cat' in names
         assert 'Dog1' in names
+    
+    def test_generated_ids_not_numeric(self):
+        """Test generated IDs are unique and never look like integers."""
+        from scratch.transpiler import ScratchTranspiler
+        
+        transpiler = ScratchTranspiler()
+        ids = [transpiler._generate_id() for _ in range(10000)]
+        assert len(set(ids)) == len(ids)
+        assert not any(block_id.isdigit() for block_id in ids)
+        assert all(block_id[0].isalpha() for block_id in ids)
 
 
 class TestReverseTranspiler:
@@ -242,6 +252,20 @@ class TestDSL:
         
         for name in dsl.__all__:
             assert hasattr(dsl, name), f"Missing export: {name}"
+    
+    def test_math_op_matches_scratch(self):
+        """Test math_op returns NaN/Infinity where Scratch does instead of raising."""
+        import math
+        from scratch.dsl import math_op
+        
+        assert math.isnan(math_op("sqrt", -1))
+        assert math.isnan(math_op("log", -1))
+        assert math.isnan(math_op("asin", 2))
+        assert math_op("ln", 0) == -math.inf
+        assert math_op("tan", 90) == math.inf
+        assert math_op("tan", 270) == -math.inf
+        assert math_op("sin", 180) == 0
+        assert math_op("10 ^", 400) == math.inf
 
 
 class TestLibrary:
@@ -286,6 +310,50 @@ class TestLibrary:
         # Case insensitive
         assert find_sprite_by_name('cat') == 'Cat'
         assert find_sprite_by_name('CAT') == 'Cat'
+    
+    def test_find_sound_with_typos(self):
+        """Test typo-tolerant sound name matching."""
+        from scratch import find_sound_by_name
+        
+        # Typos only match when allowed
+        assert find_sound_by_name('maow') is None
+        assert find_sound_by_name('maow', max_errors=1) == 'Meow'
+    
+    def test_find_sounds_by_names(self):
+        """Test batch sound lookup matches single lookups."""
+        from scratch.library import find_sound_by_name, find_sounds_by_names
+        
+        names = ['Meow', 'meow', 'POP', 'maow', 'no such sound']
+        assert find_sounds_by_names(names) == [find_sound_by_name(n) for n in names]
+        assert find_sounds_by_names(names, fuzzy=False) == ['Meow', None, None, None, None]
+
+
+class TestAssets:
+    """Tests for custom asset loading."""
+    
+    def test_wav_info_mono(self):
+        """Test WAV sample count uses the real channel count and sample width."""
+        import io
+        import wave
+        from scratch.assets import get_wav_info
+        
+        buf = io.BytesIO()
+        with wave.open(buf, 'wb') as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(22050)
+            w.writeframes(b'\x00\x00' * 1000)
+        
+        assert get_wav_info(buf.getvalue()) == (22050, 1000)
+    
+    def test_is_precompressed(self):
+        """Test only already-compressed formats are stored uncompressed."""
+        from scratch.assets import is_precompressed
+        
+        assert is_precompressed('abc.png')
+        assert is_precompressed('abc.MP3')
+        assert not is_precompressed('abc.svg')
+        assert not is_precompressed('abc.wav')
 
 
 class TestCLI:
@@ -295,6 +363,23 @@ class TestCLI:
         """Test that CLI can be imported."""
         from scratch.cli import main
         assert main is not None
+    
+    def test_cli_version(self, monkeypatch, capsys):
+        """Test --version reports the release declared in pyproject.toml."""
+        import re
+        import sys
+        from scratch.cli import main
+        
+        pyproject = os.path.join(os.path.dirname(__file__), '..', 'pyproject.toml')
+        with open(pyproject) as f:
+            version = re.search(r'^version = "([^"]+)"', f.read(), re.M).group(1)
+        
+        for flag in ('--version', '-V'):
+            monkeypatch.setattr(sys, 'argv', ['scratch', flag])
+            with pytest.raises(SystemExit) as exc:
+                main()
+            assert exc.value.code == 0
+            assert capsys.readouterr().out.strip() == f"scratch {version}"
 
 
 class TestSaveLoad: